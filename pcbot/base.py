@@ -92,7 +92,9 @@ class BaseExtensionCog(commands.Cog):
                 )
             ):
                 _, response_message = self.cached_response_messages.popitem(last=False)
-                paginator_tuple = self.cached_embed_paginators.get(response_message.id)
+                paginator_tuple = self.cached_embed_paginators.pop(
+                    response_message.id, None
+                )
                 if paginator_tuple is not None and paginator_tuple[0].is_running():  # type: ignore
                     paginator_tuple[1].cancel()  # type: ignore
 
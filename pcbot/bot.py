@@ -12,7 +12,7 @@ import inspect
 import logging
 import time
 from types import MappingProxyType, MethodType
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, Sequence
 
 
 from . import utils
@@ -47,9 +47,9 @@ class PygameCommunityBot(snakecore.commands.Bot):
 
         self._cached_response_messages_maxsize = 1000
 
-        self._cached_embed_paginators: dict[
+        self._cached_embed_paginators: OrderedDict[
             int, tuple[EmbedPaginator, asyncio.Task[None]]
-        ] = {}
+        ] = OrderedDict()
 
         self._cached_embed_paginators_maxsize = 1000
 
@@ -201,10 +201,21 @@ class PygameCommunityBot(snakecore.commands.Bot):
 
         for _ in range(min(max(resp_msg_cache_overflow, 0), 100)):
             _, response_message = self._cached_response_messages.popitem(last=False)
-            paginator_list = self._cached_embed_paginators.get(response_message.id)
+            paginator_list = self._cached_embed_paginators.pop(
+                response_message.id, None
+            )
             if paginator_list is not None and paginator_list[0].is_running():  # type: ignore
                 paginator_list[1].cancel()  # type: ignore
 
+        paginator_cache_overflow = (
+            len(self._cached_embed_paginators) - self._cached_embed_paginators_maxsize
+        )
+
+        for _ in range(min(max(paginator_cache_overflow, 0), 100)):
+            _, paginator_list = self._cached_embed_paginators.popitem(last=False)
+            if paginator_list[0].is_running():  # type: ignore
+                paginator_list[1].cancel()  # type: ignore
+
         command = ctx.invoked_subcommand or ctx.command
 
         if not ctx.command_failed:
@@ -250,6 +261,31 @@ class PygameCommunityBot(snakecore.commands.Bot):
 
             await asyncio.sleep(0.1)
 
+    async def add_cog(
+        self,
+        cog: commands.Cog,
+        /,
+        *,
+        override: bool = False,
+        guild: discord.abc.Snowflake | None = discord.utils.MISSING,
+        guilds: Sequence[discord.abc.Snowflake] = discord.utils.MISSING,
+    ) -> None:
+        await super().add_cog(cog, override=override, guild=guild, guilds=guilds)
+        self.dispatch("cog_add", cog)  # let extensions invalidate command caches
+
+    async def remove_cog(
+        self,
+        name: str,
+        /,
+        *,
+        guild: discord.abc.Snowflake | None = discord.utils.MISSING,
+        guilds: Sequence[discord.abc.Snowflake] = discord.utils.MISSING,
+    ) -> commands.Cog | None:
+        cog = await super().remove_cog(name, guild=guild, guilds=guilds)
+        if cog is not None:
+            self.dispatch("cog_remove", cog)
+        return cog
+
     async def get_context(
         self,
         origin: discord.Message | discord.Interaction,
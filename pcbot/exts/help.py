@@ -4,7 +4,9 @@ Copyright (c) 2022-present pygame-community.
 """
 
 import asyncio
-from typing import Any, Mapping
+from collections import OrderedDict
+import time
+from typing import Any, Callable, Final, Iterable, Mapping, Sequence
 
 import discord
 from discord.ext import commands
@@ -17,6 +19,110 @@ from .text_command_manager.cogs import TextCommandManagerCog
 
 BotT = PygameCommunityBot
 
+_TCM_NAME: Final = "text-command-manager"
+_ZWSP: Final = "\u200b"
+"Zero width space, used for embed field values and message content left blank."
+_ENSP: Final = "\u2002"
+"En space, used to separate command signatures in bot help embed fields."
+
+_FAST_EMBEDS: bool = True
+"""Whether help embeds should be constructed by directly setting the private
+attributes of `discord.Embed` instead of using `discord.Embed.from_dict`.
+Disable this if a discord.py update changes those internals.
+"""
+
+_FAST_EMBED_KEYS: Final = frozenset(
+    ("title", "description", "color", "fields", "footer", "author")
+)
+
+_SIG_CACHE: dict[tuple[int, bool], tuple[commands.Command, str]] = {}
+"Command signature strings keyed by command ID and markdown escaping flag."
+
+
+def _fits_single_embed(
+    embed_dict: dict[str, Any], start_embed_dict: dict[str, Any]
+) -> bool:
+    """Whether the embed resulting from merging `start_embed_dict` into `embed_dict`
+    is within Discord's embed limits, and thus doesn't need to be split.
+    """
+    merged = embed_dict | start_embed_dict
+    fields = embed_dict.get("fields", ())
+    if len(fields) > 25:
+        return False
+
+    total = 0
+    for field in fields:
+        if len(field["name"]) > 256 or len(field["value"]) > 1024:
+            return False
+        total += len(field["name"]) + len(field["value"])
+
+    description = merged.get("description") or ""
+    if len(description) > 4096:
+        return False
+
+    total += (
+        len(description)
+        + len(merged.get("title") or "")
+        + len((merged.get("footer") or {}).get("text", ""))
+        + len((merged.get("author") or {}).get("name", ""))
+    )
+    return total < 5500  # leave some headroom below the 6000 character limit
+
+
+def _fast_embed(dct: dict[str, Any]) -> discord.Embed:
+    """Construct an embed from an internally generated embed dictionary, skipping
+    the per-key handling of `discord.Embed.from_dict` where possible.
+    """
+    if not _FAST_EMBEDS or not dct.keys() <= _FAST_EMBED_KEYS:
+        return discord.Embed.from_dict(dct)
+
+    embed = discord.Embed(
+        title=dct.get("title"),
+        description=dct.get("description"),
+        color=dct.get("color"),
+    )
+    if "fields" in dct:
+        embed._fields = dct["fields"]
+    if "footer" in dct:
+        embed._footer = dct["footer"]
+    if "author" in dct:
+        embed._author = dct["author"]
+
+    return embed
+
+
+def _copy_embed_dict(dct: dict[str, Any]) -> dict[str, Any]:
+    """Copy a help embed dictionary deeply enough for the resulting embed to not
+    share any mutable state with it.
+    """
+    dct = dct.copy()
+    if "fields" in dct:
+        dct["fields"] = [field.copy() for field in dct["fields"]]
+    if "footer" in dct:
+        dct["footer"] = dct["footer"].copy()
+    if "author" in dct:
+        dct["author"] = dct["author"].copy()
+
+    return dct
+
+
+def _make_help_embeds(embed_dicts: Iterable[dict[str, Any]]) -> list[discord.Embed]:
+    """Construct new embeds from the given (possibly cached) help embed dictionaries.
+    Every call returns independent embeds, so that paginators can modify them.
+    """
+    return [_fast_embed(_copy_embed_dict(dct)) for dct in embed_dicts]
+
+
+def _command_help_fingerprint(command: commands.Command) -> tuple:
+    """The parts of a command that its help output is generated from."""
+    return (
+        command.qualified_name,
+        tuple(command.aliases),
+        command.signature,
+        command.brief,
+        command.help,
+    )
+
 
 class EmbedHelpCommand(commands.HelpCommand):
     # Based on https://gist.github.com/Rapptz/31a346ed1eb545ddeb0d451d81a60b3b
@@ -66,206 +172,386 @@ class EmbedHelpCommand(commands.HelpCommand):
     def get_command_signature(
         self, command: commands.Command, escape_markdown: bool = False
     ):
-        return (
+        key = (id(command), escape_markdown)
+        if (cached := _SIG_CACHE.get(key)) is not None and cached[0] is command:
+            return cached[1]
+
+        signature = (
             discord.utils.escape_markdown(
                 f"{command.qualified_name} {command.signature}"
             )
             if escape_markdown
             else f"{command.qualified_name} {command.signature}"
         ).strip()
+        _SIG_CACHE[key] = (command, signature)
+        return signature
+
+    async def filter_commands(
+        self,
+        cmds: Iterable[commands.Command],
+        /,
+        *,
+        sort: bool = False,
+        key: Callable[[commands.Command], Any] | None = None,
+    ) -> list[commands.Command]:
+        cog = self.cog
+        if sort and key is None and isinstance(cog, HelpCommandCog):
+            # filtering preserves order, so presorting by name is equivalent
+            cmds = cog.get_sorted_commands(cmds)
+            sort = False
+
+        return await super().filter_commands(cmds, sort=sort, key=key)
+
+    @staticmethod
+    def build_help_embed_dicts(
+        embed_dict: dict[str, Any], start_embed_dict: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        if _fits_single_embed(embed_dict, start_embed_dict):
+            embed_dict.update(start_embed_dict)
+            return [embed_dict]
+
+        # split with the common keys included, so that they count towards the
+        # embed limits of every resulting page
+        embed_dicts = []
+        for dct in snakecore.utils.embeds.split_embed_dict(
+            start_embed_dict | embed_dict
+        ):
+            dct.update(start_embed_dict)
+            embed_dicts.append(dct)
+
+        return embed_dicts
+
+    def get_text_command_manager(self) -> TextCommandManagerCog | None:
+        cog = self.cog
+        if isinstance(cog, HelpCommandCog):
+            return cog.text_command_manager
+
+        return self.context.bot.get_cog(_TCM_NAME)  # type: ignore
+
+    async def _filter_and_gate(
+        self, cmds: Iterable[commands.Command]
+    ) -> list[commands.Command]:
+        """Filter and sort the given commands, and then apply the text command
+        manager's checks to them concurrently. Non-empty results are cached on the
+        help cog for a short while per guild, channel and author, since the outcome
+        of command checks depends on all three.
+        """
+        cmds = tuple(cmds)
+        ctx = self.context
+        cog = self.cog if isinstance(self.cog, HelpCommandCog) else None
+        key = None
+        if cog is not None and ctx.guild:
+            key = (
+                ctx.guild.id,
+                ctx.channel.id,
+                ctx.author.id,
+                tuple(map(id, cmds)),
+            )
+            if (cached := cog.cached_filtered_commands.get(key)) is not None:
+                if time.monotonic() - cached[0] < cog.cached_filtered_commands_ttl:
+                    return cached[1]
+
+                del cog.cached_filtered_commands[key]
+
+        filtered = await self.filter_commands(cmds, sort=True)
+        if filtered and (text_command_manager := self.get_text_command_manager()):
+            results = await asyncio.gather(
+                *(
+                    text_command_manager.text_command_can_run(ctx, cmd)
+                    for cmd in filtered
+                )
+            )
+            filtered = [cmd for cmd, can_run in zip(filtered, results) if can_run]
+
+        # empty results aren't cached, so that re-invoking the command (e.g. by
+        # editing the invocation message) after gaining permissions shows them
+        if cog is not None and key is not None and filtered:
+            cog.cached_filtered_commands[key] = (time.monotonic(), filtered)
+            while (
+                len(cog.cached_filtered_commands) > cog.cached_filtered_commands_maxsize
+            ):
+                cog.cached_filtered_commands.popitem(last=False)
+
+        return filtered
+
+    def get_cached_help_embeds(self, key: tuple) -> list[discord.Embed] | None:
+        cog = self.cog
+        if not isinstance(cog, HelpCommandCog):
+            return None
+
+        if (embed_dicts := cog.cached_help_embeds.get(key)) is None:
+            return None
+
+        cog.cached_help_embeds.move_to_end(key)
+        return _make_help_embeds(embed_dicts)
+
+    def cache_help_embeds(self, key: tuple, embed_dicts: list[dict[str, Any]]) -> None:
+        cog = self.cog
+        if not isinstance(cog, HelpCommandCog):
+            return
+
+        cog.cached_help_embeds[key] = embed_dicts
+        while len(cog.cached_help_embeds) > cog.cached_help_embeds_maxsize:
+            cog.cached_help_embeds.popitem(last=False)
+
+    def _build_bot_help_field(
+        self, cog: commands.Cog | None, filtered: Sequence[commands.Command]
+    ) -> dict[str, Any]:
+        value = _ENSP.join(
+            [
+                f"`{sig}`" if len(sig) < 16 else f"`{c.qualified_name} ...`"
+                for c, sig in zip(
+                    filtered, [self.get_command_signature(c) for c in filtered]
+                )
+            ]
+        )
+        if cog and cog.description:
+            value = f"{cog.description}\n\n**Commands**\n{value}"
+
+        return {
+            "name": "No Category" if cog is None else cog.qualified_name,
+            "value": value,
+            "inline": True,
+        }
 
     async def send_bot_help(
         self, mapping: Mapping[commands.Cog | None, list[commands.Command]]
     ):
+        ending_note = self.get_ending_note()
+        color_int = int(self.theme_color)
+
         start_embed_dict = {}
         start_embed_dict["title"] = "Help"
-        start_embed_dict["color"] = int(self.theme_color)
+        start_embed_dict["color"] = color_int
 
         description = self.bot_help_message or self.context.bot.description
         if description:
             start_embed_dict["description"] = description
 
-        embed_dict = start_embed_dict.copy()
+        if not (self.context.guild and mapping):
+            await self.send_paginated_response_embeds(
+                discord.Embed.from_dict(start_embed_dict)
+            )
+            return
 
-        if self.context.guild:
-            if mapping:
-                embed_dict["fields"] = []
+        # common keys are merged into every split page from start_embed_dict
+        embed_dict: dict[str, Any] = {"fields": []}
 
-            text_command_manager: TextCommandManagerCog = self.context.bot.get_cog("text-command-manager")  # type: ignore
+        mapping_items = tuple(mapping.items())
+        filtered_lists: list[list[commands.Command]] = list(
+            await asyncio.gather(
+                *(self._filter_and_gate(cmds) for _, cmds in mapping_items)
+            )
+        )
 
-            shown_cog_count = 0
+        cache_key = (
+            "bot",
+            self.context.guild.id,
+            ending_note,
+            description,
+            tuple(
+                (
+                    id(cog),
+                    cog and cog.description,
+                    tuple(map(_command_help_fingerprint, filtered)),
+                )
+                for (cog, _), filtered in zip(mapping_items, filtered_lists)
+            ),
+        )
+        if (cached_embeds := self.get_cached_help_embeds(cache_key)) is not None:
+            await self.send_paginated_response_embeds(*cached_embeds)
+            return
 
-            for cog, cmds in mapping.items():
-                name = "No Category" if cog is None else cog.qualified_name
-                if text_command_manager:
-                    filtered = [
-                        cmd
-                        for cmd in await self.filter_commands(cmds, sort=True)
-                        if await text_command_manager.text_command_can_run(
-                            self.context, cmd
-                        )
-                    ]
-                else:
-                    filtered = await self.filter_commands(cmds, sort=True)
-                if filtered:
-                    value = "\u2002".join(
-                        "`"
-                        + (
-                            self.get_command_signature(c)
-                            if len((sig := self.get_command_signature(c))) < 16
-                            else c.qualified_name + " ..."
-                        )
-                        + "`"
-                        for c in filtered
-                    )
-                    if cog and cog.description:
-                        value = f"{cog.description}\n\n**Commands**\n{value}"
+        cog_fields = [
+            self._build_bot_help_field(cog, filtered)
+            for (cog, _), filtered in zip(mapping_items, filtered_lists)
+            if filtered
+        ]
+        if cog_fields:
+            embed_dict["fields"] = [
+                {"name": f"Categories: {len(cog_fields)}", "value": _ZWSP},
+                *cog_fields,
+            ]
 
-                    embed_dict["fields"].append(
-                        dict(name=name, value=value, inline=True)
-                    )
-                    shown_cog_count += 1
-
-            if shown_cog_count:
-                embed_dict["fields"].insert(
-                    0,
-                    dict(
-                        name=f"Categories: {shown_cog_count}",
-                        value="\u200b",
-                    ),
-                )
+        embed_dict["footer"] = {"text": ending_note}
 
-            embed_dict["footer"] = dict(text=self.get_ending_note())
+        embed_dicts = self.build_help_embed_dicts(embed_dict, start_embed_dict)
 
-        await self.send_paginated_response_embeds(
-            *(
-                discord.Embed.from_dict(dct | start_embed_dict)
-                for dct in snakecore.utils.embeds.split_embed_dict(embed_dict)
-            ),
-        )
+        self.cache_help_embeds(cache_key, embed_dicts)
+        await self.send_paginated_response_embeds(*_make_help_embeds(embed_dicts))
 
     async def send_cog_help(self, cog: commands.Cog):
         if not self.context.guild:
             return
 
+        ending_note = self.get_ending_note()
+        get_command_signature = self.get_command_signature
+        color_int = int(self.theme_color)
+
         start_embed_dict = {}
         start_embed_dict["title"] = f"`{cog.qualified_name}` Commands"
-        start_embed_dict["color"] = int(self.theme_color)
-        start_embed_dict["footer"] = dict(text=self.get_ending_note())
+        start_embed_dict["color"] = color_int
+        start_embed_dict["footer"] = {"text": ending_note}
 
-        embed_dict = start_embed_dict.copy()
+        embed_dict: dict[str, Any] = {}
         if cog.description:
             embed_dict["description"] = cog.description
 
-        text_command_manager: TextCommandManagerCog = self.context.bot.get_cog("text-command-manager")  # type: ignore
+        filtered = await self._filter_and_gate(cog.get_commands())
 
-        if text_command_manager:
-            filtered = [
-                cmd
-                for cmd in await self.filter_commands(cog.get_commands(), sort=True)
-                if await text_command_manager.text_command_can_run(self.context, cmd)
-            ]
-        else:
-            filtered = await self.filter_commands(cog.get_commands(), sort=True)
+        cache_key = (
+            "cog",
+            id(cog),
+            cog.description,
+            self.context.guild.id,
+            ending_note,
+            tuple(map(_command_help_fingerprint, filtered)),
+        )
+        if (cached_embeds := self.get_cached_help_embeds(cache_key)) is not None:
+            await self.send_paginated_response_embeds(*cached_embeds)
+            return
 
         embed_dict["fields"] = []
         embed_dict["fields"].append(
-            dict(name=f"Subcommands: {len(filtered)}", value="\u200b")
+            {"name": f"Subcommands: {len(filtered)}", "value": _ZWSP}
         )
         embed_dict["fields"].extend(
             (
-                dict(
-                    name=f"`{self.get_command_signature(command)}`",
-                    value=command.short_doc or "\u200b",
-                    inline=False,
-                )
+                {
+                    "name": f"`{get_command_signature(command)}`",
+                    "value": command.short_doc or _ZWSP,
+                    "inline": False,
+                }
                 for command in filtered
             )
         )
 
-        await self.send_paginated_response_embeds(
-            *(
-                discord.Embed.from_dict(
-                    dct
-                    | dict(
-                        title=start_embed_dict["title"],
-                        color=start_embed_dict["color"],
-                        footer=start_embed_dict["footer"],
-                    )
-                )
-                for dct in snakecore.utils.embeds.split_embed_dict(embed_dict)
-            ),
-        )
-
-    async def send_group_help(self, group: commands.Group):
-        if not self.context.guild:
-            return
+        embed_dicts = self.build_help_embed_dicts(embed_dict, start_embed_dict)
+        self.cache_help_embeds(cache_key, embed_dicts)
+        await self.send_paginated_response_embeds(*_make_help_embeds(embed_dicts))
 
+    def _build_single_command_embed(
+        self, command: commands.Command, color_int: int
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
         start_embed_dict = {}
-        start_embed_dict["title"] = f"Help for `{group.qualified_name}`" + (
-            " (a.k.a. " + ", ".join(f"`{alias}`" for alias in group.aliases) + " )"
-            if group.aliases
+        start_embed_dict["title"] = f"Help for `{command.qualified_name}`" + (
+            " (a.k.a. " + ", ".join(f"`{alias}`" for alias in command.aliases) + " )"
+            if command.aliases
             else ""
         )
-        start_embed_dict["color"] = int(self.theme_color)
-        if isinstance(group.cog, commands.Cog):
-            start_embed_dict["author"] = dict(name=f"{group.cog.qualified_name}")
+        start_embed_dict["color"] = color_int
+        if isinstance(command.cog, commands.Cog):
+            start_embed_dict["author"] = {"name": f"{command.cog.qualified_name}"}
 
-        embed_dict = start_embed_dict.copy()
-        embed_dict["description"] = ""
+        embed_dict: dict[str, Any] = {"description": ""}
 
         if (
-            signature_str := self.get_command_signature(group)
-        ) != group.qualified_name:  # ignore empty signatures
+            signature_str := self.get_command_signature(command)
+        ) != command.qualified_name:  # ignore empty signatures
             embed_dict["description"] = f"```\n{signature_str}```\n"
 
-        if group.help:
-            embed_dict["description"] += group.help
+        if command.help:
+            embed_dict["description"] += command.help
+
+        return start_embed_dict, embed_dict
+
+    async def send_group_help(self, group: commands.Group):
+        if not self.context.guild:
+            return
+
+        text_command_manager = self.get_text_command_manager()
+        ending_note = self.get_ending_note()
+        get_command_signature = self.get_command_signature
+        color_int = int(self.theme_color)
+
+        # filter subcommands while the group itself is being checked
+        filtered_task = asyncio.create_task(self._filter_and_gate(group.commands))
 
-        text_command_manager: TextCommandManagerCog = self.context.bot.get_cog("text-command-manager")  # type: ignore
         if text_command_manager:
-            if not await text_command_manager.text_command_can_run(self.context, group):
+            try:
+                can_run = await text_command_manager.text_command_can_run(
+                    self.context, group
+                )
+            except BaseException:
+                filtered_task.cancel()
+                raise
+
+            if not can_run:
+                filtered_task.cancel()
                 return
 
-        if isinstance(group, commands.Group):
-            if text_command_manager:
-                filtered = [
-                    cmd
-                    for cmd in await self.filter_commands(group.commands, sort=True)
-                    if await text_command_manager.text_command_can_run(
-                        self.context, cmd
-                    )
-                ]
-            else:
-                filtered = await self.filter_commands(group.commands, sort=True)
-            embed_dict["fields"] = []
-            embed_dict["fields"].append(
-                dict(name=f"Subcommands: {len(filtered)}", value="\u200b")
-            )
-            embed_dict["fields"].extend(
-                (
-                    dict(
-                        name=f"`{self.get_command_signature(command)}`",
-                        value=command.short_doc or "\u200b",
-                        inline=False,
-                    )
-                    for command in filtered
-                )
+        filtered = await filtered_task
+
+        cache_key = (
+            "group",
+            id(group),
+            _command_help_fingerprint(group),
+            self.context.guild.id,
+            ending_note,
+            tuple(map(_command_help_fingerprint, filtered)),
+        )
+        if (cached_embeds := self.get_cached_help_embeds(cache_key)) is not None:
+            await self.send_paginated_response_embeds(*cached_embeds)
+            return
+
+        start_embed_dict, embed_dict = self._build_single_command_embed(
+            group, color_int
+        )
+
+        embed_dict["fields"] = []
+        embed_dict["fields"].append(
+            {"name": f"Subcommands: {len(filtered)}", "value": _ZWSP}
+        )
+        embed_dict["fields"].extend(
+            (
+                {
+                    "name": f"`{get_command_signature(command)}`",
+                    "value": command.short_doc or _ZWSP,
+                    "inline": False,
+                }
+                for command in filtered
             )
+        )
 
-        embed_dict["footer"] = dict(text=self.get_ending_note())
+        embed_dict["footer"] = {"text": ending_note}
 
-        await self.send_paginated_response_embeds(
-            *(
-                discord.Embed.from_dict(dct | start_embed_dict)
-                for dct in snakecore.utils.embeds.split_embed_dict(embed_dict)
-            ),
+        embed_dicts = self.build_help_embed_dicts(embed_dict, start_embed_dict)
+        self.cache_help_embeds(cache_key, embed_dicts)
+        await self.send_paginated_response_embeds(*_make_help_embeds(embed_dicts))
+
+    async def send_command_help(self, command: commands.Command):
+        if not self.context.guild:
+            return
+
+        text_command_manager = self.get_text_command_manager()
+        ending_note = self.get_ending_note()
+        color_int = int(self.theme_color)
+
+        if text_command_manager:
+            if not await text_command_manager.text_command_can_run(
+                self.context, command
+            ):
+                return
+
+        cache_key = (
+            "command",
+            id(command),
+            _command_help_fingerprint(command),
+            self.context.guild.id,
+            ending_note,
         )
+        if (cached_embeds := self.get_cached_help_embeds(cache_key)) is not None:
+            await self.send_paginated_response_embeds(*cached_embeds)
+            return
 
-    # This makes it so it uses the function above
-    # Less work for us to do since they're both similar.
-    # If you want to make regular command help look different then override it
-    send_command_help = send_group_help  # type: ignore
+        start_embed_dict, embed_dict = self._build_single_command_embed(
+            command, color_int
+        )
+        embed_dict["footer"] = {"text": ending_note}
+
+        embed_dicts = self.build_help_embed_dicts(embed_dict, start_embed_dict)
+        self.cache_help_embeds(cache_key, embed_dicts)
+        await self.send_paginated_response_embeds(*_make_help_embeds(embed_dicts))
 
     async def send_error_message(self, error: str, /) -> None:
         return await self.send_paginated_response_embeds(
@@ -287,11 +573,13 @@ class EmbedHelpCommand(commands.HelpCommand):
         if not isinstance(cog, BaseExtensionCog):
             raise RuntimeError("A BaseExtensionCog cog instance must be set")
 
-        paginator = None
-
         if not embeds:
             return
 
+        # embeds are passed through as they are, a single one is sent or edited in
+        # directly without a paginator
+        single_embed = embeds[0] if len(embeds) == 1 else None
+
         destination = self.get_destination()
 
         if (
@@ -306,14 +594,14 @@ class EmbedHelpCommand(commands.HelpCommand):
                     if paginator_tuple[0].is_running():
                         await paginator_tuple[0].stop()
 
-                if len(embeds) == 1:
-                    await response_message.edit(embed=embeds[0])
+                if single_embed is not None:
+                    await response_message.edit(embed=single_embed)
                     return
 
                 paginator = snakecore.utils.pagination.EmbedPaginator(
                     (
                         response_message := await response_message.edit(
-                            content="\u200b", embed=None
+                            content=_ZWSP, embed=None
                         )
                     ),
                     *embeds,
@@ -322,28 +610,28 @@ class EmbedHelpCommand(commands.HelpCommand):
                     theme_color=int(self.theme_color),
                 )
             except discord.NotFound:
-                if len(embeds) == 1:
+                if single_embed is not None:
                     cog.cached_response_messages[
                         ctx.message.id
-                    ] = await destination.send(embed=embeds[0])
+                    ] = await destination.send(embed=single_embed)
                     return
 
                 paginator = snakecore.utils.pagination.EmbedPaginator(
-                    (response_message := await destination.send(content="\u200b")),
+                    (response_message := await destination.send(content=_ZWSP)),
                     *embeds,
                     member=ctx.author,
                     inactivity_timeout=60,
                     theme_color=int(self.theme_color),
                 )
         else:
-            if len(embeds) == 1:
+            if single_embed is not None:
                 cog.cached_response_messages[ctx.message.id] = await destination.send(
-                    embed=embeds[0]
+                    embed=single_embed
                 )
                 return
 
             paginator = snakecore.utils.pagination.EmbedPaginator(
-                (response_message := await destination.send(content="\u200b")),
+                (response_message := await destination.send(content=_ZWSP)),
                 *embeds,
                 member=ctx.author,
                 inactivity_timeout=60,
@@ -363,12 +651,57 @@ class EmbedHelpCommand(commands.HelpCommand):
 
 
 class HelpCommandCog(BaseExtensionCog, name="help-commands"):
-    pass
+    def __init__(self, bot: BotT, theme_color: int | discord.Color = 0) -> None:
+        super().__init__(bot, theme_color=theme_color)
+        self.cached_help_embeds: OrderedDict[
+            tuple, list[dict[str, Any]]
+        ] = OrderedDict()
+        self.cached_help_embeds_maxsize: int = 64
+        self.cached_sorted_commands: dict[tuple[int, ...], list[commands.Command]] = {}
+        self.cached_filtered_commands: OrderedDict[
+            tuple, tuple[float, list[commands.Command]]
+        ] = OrderedDict()
+        self.cached_filtered_commands_maxsize: int = 256
+        self.cached_filtered_commands_ttl: float = 60.0
+        self.text_command_manager: TextCommandManagerCog | None = None
+
+    def get_sorted_commands(
+        self, cmds: Iterable[commands.Command]
+    ) -> list[commands.Command]:
+        cmds = tuple(cmds)
+        key = tuple(map(id, cmds))
+        if (sorted_cmds := self.cached_sorted_commands.get(key)) is None:
+            sorted_cmds = self.cached_sorted_commands[key] = sorted(
+                cmds, key=lambda c: c.name
+            )
+
+        return sorted_cmds
+
+    @commands.Cog.listener()
+    async def on_cog_add(self, cog: commands.Cog):
+        if isinstance(cog, TextCommandManagerCog):
+            self.text_command_manager = cog
+
+        self.cached_sorted_commands.clear()
+        self.cached_filtered_commands.clear()
+        self.cached_help_embeds.clear()
+
+    @commands.Cog.listener()
+    async def on_cog_remove(self, cog: commands.Cog):
+        if cog is self.text_command_manager:
+            self.text_command_manager = None
+
+        self.cached_sorted_commands.clear()
+        self.cached_filtered_commands.clear()
+        self.cached_help_embeds.clear()
 
 
 @snakecore.commands.decorators.with_config_kwargs
 async def setup(bot: BotT, bot_help_message: str = "", color: int | discord.Color = 0):
+    _SIG_CACHE.clear()
     await bot.add_cog((help_command_cog := HelpCommandCog(bot)))  # type: ignore
+    # kept up to date by the cog_add and cog_remove listeners afterwards
+    help_command_cog.text_command_manager = bot.get_cog(_TCM_NAME)  # type: ignore
     embed_help_command = EmbedHelpCommand(
         bot_help_message=bot_help_message, theme_color=int(color)
     )
@@ -6,28 +6,42 @@ Copyright (c) 2022-present pygame-community.
 from __future__ import annotations
 import asyncio
 import datetime
-import itertools
+import functools
+import json
+import logging
 import pickle
 import time
 
-from typing import TYPE_CHECKING, Callable, NotRequired, TypedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    NotRequired,
+    TypedDict,
+    TypeVar,
+)
 
 import discord
 from discord.ext import commands, tasks
 import snakecore
-from sqlalchemy import text
+from sqlalchemy import bindparam, inspect, text
 from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection
 
 from .constants import (
     DB_PREFIX,
     HELP_FORUM_CHANNEL_IDS,
+    HELP_FORUM_CHANNEL_IDS_SET,
     HELPFULIE_ROLE_ID,
     FORUM_THREAD_TAG_LIMIT,
     INVALID_HELP_THREAD_EMBEDS,
-    INVALID_HELP_THREAD_REGEX_PATTERNS,
-    INVALID_HELP_THREAD_SCANNING_ENABLED,
-    INVALID_HELP_THREAD_TYPES,
+    INVALID_HELP_THREAD_SCANS,
+    INVALID_HELP_THREAD_TITLE_PATTERN,
     THREAD_TITLE_TOO_SHORT_SLOWMODE_DELAY,
     THREAD_DELETION_MESSAGE_THRESHOLD,
 )
@@ -38,6 +52,189 @@ from ...bot import PygameCommunityBot
 
 BotT = PygameCommunityBot
 
+_logger = logging.getLogger(__package__)
+
+_T = TypeVar("_T")
+
+
+def _encode_caution_message_ids(caution_message_ids: Iterable[int]) -> str:
+    """Encode caution message IDs as a compact, sorted JSON array."""
+    return json.dumps(sorted(caution_message_ids), separators=(",", ":"))
+
+
+_SOLVED_TAG = 1 << 0
+_UNSOLVED_TAG = 1 << 1
+_ABANDONED_TAG = 1 << 2
+_INVALID_TAG = 1 << 3
+_ISSUE_TAG = 1 << 4
+
+
+@functools.lru_cache(maxsize=256)
+def _get_tag_name_flags(name: str) -> int:
+    name = name.lower()
+    return (
+        (_SOLVED_TAG if name.startswith("solved") else 0)
+        | (_UNSOLVED_TAG if name.startswith("unsolved") else 0)
+        | (_ABANDONED_TAG if name.startswith("abandoned") else 0)
+        | (_INVALID_TAG if name.startswith("invalid") else 0)
+        | (_ISSUE_TAG if name.startswith("issue") else 0)
+    )
+
+
+def _get_tag_flags(tag: discord.ForumTag) -> int:
+    """Classify a forum tag by its name prefix into a combination of the `_*_TAG`
+    bit flags. Results are cached by tag name, since tags rarely change.
+    """
+    return _get_tag_name_flags(tag.name)
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_help_thread_title(name: str, owner_id: int) -> str:
+    """Strip the owner ID suffixes from a help thread name, and trim and normalize
+    its whitespace. Results are cached, since thread names are scanned on every
+    relevant event.
+    """
+    owner_id_str = str(owner_id)
+    return " ".join(
+        name.replace(f"│{owner_id_str}", "")
+        .replace(f"│{owner_id_str[-6:]}", "")
+        .split()
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _get_owner_id_strings(owner_id: int) -> tuple[str, str]:
+    """Return the full owner ID string and the owner ID suffix used in help thread
+    names. Results are cached, since thread owners recur across maintenance runs.
+    """
+    owner_id_str = str(owner_id)
+    return owner_id_str, f"│{owner_id_str[-6:]}"
+
+
+def _get_missing_owner_id_suffix(thread: discord.Thread) -> str | None:
+    """Return the owner ID suffix to append to the name of a help thread, or `None`
+    if its name already ends with that suffix or contains the full owner ID.
+    """
+    owner_id, owner_id_suffix = _get_owner_id_strings(thread.owner_id)
+    if thread.name.endswith(owner_id_suffix) or owner_id in thread.name:
+        return None
+
+    return owner_id_suffix
+
+
+def _get_last_cautioned_ts(caution_messages: list[discord.Message]) -> float:
+    """Return the creation time of the most recent caution message, which is
+    decoded from its ID, or the current time if no caution messages were sent.
+    """
+    if caution_messages:
+        return max(msg.created_at for msg in caution_messages).timestamp()
+
+    return time.time()
+
+
+# maximum number of help threads processed concurrently by the hourly passes
+_HELP_THREAD_CONCURRENCY_LIMIT = 8
+
+
+async def _gather_limited(limit: int, aws: Iterable[Awaitable[_T]]) -> list[_T | None]:
+    """Like `asyncio.gather()`, but awaits at most `limit` awaitables at a time.
+    Exceptions raised by an awaitable are logged and result in `None`, so that one
+    failure doesn't abort the others.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[_T]) -> _T | None:
+        async with semaphore:
+            try:
+                return await aw
+            except Exception:
+                _logger.exception("Unhandled exception while processing help thread")
+                return None
+
+    return await asyncio.gather(*map(run, aws))
+
+
+# sending an embed doesn't modify it, so these can be shared by all caution messages
+_CAUTION_EMBEDS = {
+    caution_type: discord.Embed.from_dict(embed_dict)
+    for caution_type, embed_dict in INVALID_HELP_THREAD_EMBEDS.items()
+}
+
+_WHITE_CHECK_MARK = "✅"
+
+
+def _get_white_check_mark_reaction(msg: discord.Message) -> discord.Reaction | None:
+    for reaction in msg.reactions:
+        emoji = reaction.emoji
+        if emoji == _WHITE_CHECK_MARK or (
+            isinstance(emoji, discord.PartialEmoji) and emoji.name == _WHITE_CHECK_MARK
+        ):
+            return reaction
+
+    return None
+
+
+# SQL statements used on every relevant event, built once at import time
+_BAD_HELP_THREAD_DATA_COLUMNS = (
+    "thread_id",
+    "last_cautioned_ts",
+    "caution_message_ids",
+)
+_INACTIVE_HELP_THREAD_DATA_COLUMNS = ("thread_id", "last_active_ts", "alert_message_id")
+
+_SELECT_BAD_IDS = text(f"SELECT thread_id FROM '{DB_PREFIX}bad_help_thread_data'")
+_SELECT_BAD = text(
+    f"SELECT * FROM '{DB_PREFIX}bad_help_thread_data' WHERE thread_id == :thread_id"
+)
+_SAVE_BAD = text(
+    "INSERT INTO "
+    f"'{DB_PREFIX}bad_help_thread_data' AS bad_help_thread_data "
+    f"({', '.join(_BAD_HELP_THREAD_DATA_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + k for k in _BAD_HELP_THREAD_DATA_COLUMNS)}) "
+    "ON CONFLICT (thread_id) DO UPDATE SET "
+    + ", ".join(f"{k} = excluded.{k}" for k in _BAD_HELP_THREAD_DATA_COLUMNS[1:])
+)
+# unlike _SAVE_BAD, this merges the given caution message IDs with the stored ones
+_MERGE_BAD = text(
+    "INSERT INTO "
+    f"'{DB_PREFIX}bad_help_thread_data' AS bad_help_thread_data "
+    f"({', '.join(_BAD_HELP_THREAD_DATA_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + k for k in _BAD_HELP_THREAD_DATA_COLUMNS)}) "
+    "ON CONFLICT (thread_id) DO UPDATE SET "
+    "last_cautioned_ts = excluded.last_cautioned_ts, "
+    "caution_message_ids = (SELECT json_group_array(value) FROM ("
+    "SELECT value FROM json_each(bad_help_thread_data.caution_message_ids) "
+    "UNION SELECT value FROM json_each(excluded.caution_message_ids)))"
+)
+_DEL_BAD = text(
+    f"DELETE FROM '{DB_PREFIX}bad_help_thread_data' AS bad_help_thread_data "
+    "WHERE bad_help_thread_data.thread_id == :thread_id"
+)
+
+_SELECT_INACTIVE_IDS = text(
+    f"SELECT thread_id FROM '{DB_PREFIX}inactive_help_thread_data'"
+)
+_SELECT_INACTIVE = text(
+    f"SELECT * FROM '{DB_PREFIX}inactive_help_thread_data' "
+    "WHERE thread_id == :thread_id"
+)
+_SELECT_INACTIVE_IN = text(
+    f"SELECT * FROM '{DB_PREFIX}inactive_help_thread_data' "
+    "WHERE thread_id IN :thread_ids"
+).bindparams(bindparam("thread_ids", expanding=True))
+_SAVE_INACTIVE = text(
+    "INSERT INTO "
+    f"'{DB_PREFIX}inactive_help_thread_data' AS inactive_help_thread_data "
+    f"({', '.join(_INACTIVE_HELP_THREAD_DATA_COLUMNS)}) "
+    f"VALUES ({', '.join(':' + k for k in _INACTIVE_HELP_THREAD_DATA_COLUMNS)}) "
+    "ON CONFLICT (thread_id) DO UPDATE SET "
+    + ", ".join(f"{k} = excluded.{k}" for k in _INACTIVE_HELP_THREAD_DATA_COLUMNS[1:])
+)
+_DEL_INACTIVE = text(
+    f"DELETE FROM '{DB_PREFIX}inactive_help_thread_data' AS inactive_help_thread_data "
+    "WHERE inactive_help_thread_data.thread_id == :thread_id"
+)
+
 
 class BadHelpThreadData(TypedDict):
     thread_id: int
@@ -51,6 +248,17 @@ class InactiveHelpThreadData(TypedDict):
     alert_message_id: NotRequired[int]
 
 
+def _make_inactive_help_thread_data(mapping: Mapping) -> InactiveHelpThreadData:
+    output = InactiveHelpThreadData(
+        thread_id=mapping["thread_id"], last_active_ts=mapping["last_active_ts"]
+    )
+
+    if (alert_message_id := mapping["alert_message_id"]) is not None:
+        output["alert_message_id"] = alert_message_id
+
+    return output
+
+
 class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
     def __init__(
         self,
@@ -63,45 +271,86 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
         self.bot: BotT
         self.db_engine = db_engine
         self.revision_number = revision_number
+        # IDs of all threads with stored data, mirrored from the database tables
+        self.bad_help_thread_ids: set[int] = set()
+        self.inactive_help_thread_ids: set[int] = set()
+        # thread ID -> (monotonic deadline, edited fields) of every bot edit whose
+        # thread update event is still pending
+        self.self_edited_help_threads: dict[
+            int, list[tuple[float, dict[str, Any]]]
+        ] = {}
+        # forum channel ID -> (monotonic expiry time, forum channel fetched via HTTP)
+        self.fetched_help_forum_channels: dict[
+            int, tuple[float, discord.ForumChannel]
+        ] = {}
+        # forum channel ID -> `_*_TAG` flag -> first available tag with that flag
+        self.help_forum_channel_tags: dict[int, dict[int, discord.ForumTag | None]] = {}
+
+    async def cog_load(self) -> None:
+        await self.convert_legacy_caution_message_ids()
+        await self.load_help_thread_ids()
 
     async def cog_unload(self) -> None:
-        self.inactive_help_thread_alert.stop()
-        self.force_help_thread_archive_after_timeout.stop()
-        self.tag_inactive_help_threads_as_abandoned.stop()
+        self.help_thread_maintenance.stop()
 
     @commands.Cog.listener()
     async def on_ready(self):
-        for task_loop in (
-            self.inactive_help_thread_alert,
-            self.force_help_thread_archive_after_timeout,
-            self.tag_inactive_help_threads_as_abandoned,
-        ):
-            if not task_loop.is_running():
-                task_loop.start()
+        if not self.help_thread_maintenance.is_running():
+            self.help_thread_maintenance.start()
+
+    async def convert_legacy_caution_message_ids(self) -> None:
+        """Move the bad help thread data left behind in a legacy table by
+        migration revision 1 into the current table, converting its pickled
+        caution message IDs to JSON. The legacy table is dropped afterwards, so
+        this only does work once.
+        """
+        legacy_table_name = f"{DB_PREFIX}bad_help_thread_data_legacy"
+        conn: AsyncConnection
+        async with self.db_engine.begin() as conn:
+            if not await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).has_table(legacy_table_name)
+            ):
+                return
 
-    async def bad_help_thread_data_exists(self, thread_id: int) -> bool:
+            result: Result = await conn.execute(
+                text(
+                    "SELECT thread_id, last_cautioned_ts, caution_message_ids "
+                    f"FROM '{legacy_table_name}'"
+                )
+            )
+            legacy_rows = [
+                dict(
+                    thread_id=thread_id,
+                    last_cautioned_ts=last_cautioned_ts,
+                    caution_message_ids=_encode_caution_message_ids(
+                        pickle.loads(caution_message_ids)
+                    ),
+                )
+                for thread_id, last_cautioned_ts, caution_message_ids in result.all()
+            ]
+            if legacy_rows:
+                await conn.execute(_SAVE_BAD, legacy_rows)
+
+            await conn.execute(text(f"DROP TABLE '{legacy_table_name}'"))
+
+    async def load_help_thread_ids(self) -> None:
         conn: AsyncConnection
         async with self.db_engine.connect() as conn:
-            return bool(
-                (
-                    await conn.execute(
-                        text(
-                            f"SELECT EXISTS(SELECT 1 FROM '{DB_PREFIX}bad_help_thread_data' "
-                            "WHERE thread_id == :thread_id LIMIT 1)"
-                        ),
-                        dict(thread_id=thread_id),
-                    )
-                ).scalar()
+            self.bad_help_thread_ids = set(
+                (await conn.execute(_SELECT_BAD_IDS)).scalars()
             )
+            self.inactive_help_thread_ids = set(
+                (await conn.execute(_SELECT_INACTIVE_IDS)).scalars()
+            )
+
+    async def bad_help_thread_data_exists(self, thread_id: int) -> bool:
+        return thread_id in self.bad_help_thread_ids
 
     async def fetch_bad_help_thread_data(self, thread_id: int) -> BadHelpThreadData:
         conn: AsyncConnection
         async with self.db_engine.connect() as conn:
             result: Result = await conn.execute(
-                text(
-                    f"SELECT * FROM '{DB_PREFIX}bad_help_thread_data' "
-                    "WHERE thread_id == :thread_id"
-                ),
+                _SELECT_BAD,
                 dict(thread_id=thread_id),
             )
 
@@ -111,63 +360,67 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                     f"No bad help thread data found for thread with ID {thread_id}"
                 )
 
-            row_dict = row._asdict()  # type: ignore
+            mapping = row._mapping
 
             return BadHelpThreadData(
                 thread_id=thread_id,
-                last_cautioned_ts=row_dict["last_cautioned_ts"],
-                caution_message_ids=pickle.loads(row_dict["caution_message_ids"]),
+                last_cautioned_ts=mapping["last_cautioned_ts"],
+                caution_message_ids=set(json.loads(mapping["caution_message_ids"])),
             )
 
+    async def fetch_bad_help_thread_data_or_none(
+        self, thread_id: int
+    ) -> BadHelpThreadData | None:
+        if thread_id not in self.bad_help_thread_ids:
+            return None
+
+        try:
+            return await self.fetch_bad_help_thread_data(thread_id)
+        except LookupError:
+            return None
+
     async def save_bad_help_thread_data(self, data: BadHelpThreadData) -> None:
-        target_columns = (
-            "thread_id",
-            "last_cautioned_ts",
-            "caution_message_ids",
-        )
-        target_update_set_columns = ", ".join((f"{k} = :{k}" for k in target_columns))
+        conn: AsyncConnection
+        async with self.db_engine.begin() as conn:
+            await conn.execute(
+                _SAVE_BAD,
+                data
+                | dict(
+                    caution_message_ids=_encode_caution_message_ids(
+                        data["caution_message_ids"]
+                    )
+                ),  # type: ignore
+            )
+        self.bad_help_thread_ids.add(data["thread_id"])
 
+    async def merge_bad_help_thread_data(self, data: BadHelpThreadData) -> None:
+        """Save bad help thread data, while keeping any caution message IDs that
+        were already stored for the thread. The union is computed by the database.
+        """
         conn: AsyncConnection
         async with self.db_engine.begin() as conn:
             await conn.execute(
-                text(
-                    "INSERT INTO "
-                    f"'{DB_PREFIX}bad_help_thread_data' AS bad_help_thread_data "
-                    f"({', '.join(target_columns)}) "
-                    f"VALUES ({', '.join(':'+colname for colname in target_columns)}) "
-                    f"ON CONFLICT DO UPDATE SET {target_update_set_columns} "
-                    "WHERE bad_help_thread_data.thread_id == :thread_id"
-                ),
+                _MERGE_BAD,
                 data
-                | dict(caution_message_ids=pickle.dumps(data["caution_message_ids"])),  # type: ignore
+                | dict(
+                    caution_message_ids=_encode_caution_message_ids(
+                        data["caution_message_ids"]
+                    )
+                ),  # type: ignore
             )
+        self.bad_help_thread_ids.add(data["thread_id"])
 
     async def delete_bad_help_thread_data(self, thread_id: int) -> None:
         conn: AsyncConnection
-        async with self.db_engine.connect() as conn:
+        async with self.db_engine.begin() as conn:
             await conn.execute(
-                text(
-                    f"DELETE FROM '{DB_PREFIX}bad_help_thread_data' "
-                    "AS bad_help_thread_data "
-                    "WHERE bad_help_thread_data.thread_id == :thread_id"
-                ),
+                _DEL_BAD,
                 dict(thread_id=thread_id),
             )
+        self.bad_help_thread_ids.discard(thread_id)
 
     async def inactive_help_thread_data_exists(self, thread_id: int) -> bool:
-        conn: AsyncConnection
-        async with self.db_engine.connect() as conn:
-            return bool(
-                (
-                    await conn.execute(
-                        text(
-                            f"SELECT EXISTS(SELECT 1 FROM '{DB_PREFIX}inactive_help_thread_data' "
-                            "WHERE thread_id == :thread_id LIMIT 1)"
-                        ),
-                        dict(thread_id=thread_id),
-                    )
-                ).scalar()
-            )
+        return thread_id in self.inactive_help_thread_ids
 
     async def fetch_inactive_help_thread_data(
         self, thread_id: int
@@ -175,10 +428,7 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
         conn: AsyncConnection
         async with self.db_engine.connect() as conn:
             result: Result = await conn.execute(
-                text(
-                    f"SELECT * FROM '{DB_PREFIX}inactive_help_thread_data' "
-                    "WHERE thread_id == :thread_id"
-                ),
+                _SELECT_INACTIVE,
                 dict(thread_id=thread_id),
             )
 
@@ -188,56 +438,220 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                     f"No inactive help thread data found for thread with ID {thread_id}"
                 )
 
-            row_dict = row._asdict()  # type: ignore
+            return _make_inactive_help_thread_data(row._mapping)
 
-            output = InactiveHelpThreadData(
-                thread_id=thread_id, last_active_ts=row_dict["last_active_ts"]
+    async def fetch_inactive_help_thread_data_batch(
+        self, thread_ids: Iterable[int]
+    ) -> dict[int, InactiveHelpThreadData]:
+        """Fetch the inactive help thread data of all given threads that have any
+        in one query, mapped by thread ID.
+        """
+        thread_ids = [
+            thread_id
+            for thread_id in thread_ids
+            if thread_id in self.inactive_help_thread_ids
+        ]
+        if not thread_ids:
+            return {}
+
+        conn: AsyncConnection
+        async with self.db_engine.connect() as conn:
+            result: Result = await conn.execute(
+                _SELECT_INACTIVE_IN,
+                dict(thread_ids=thread_ids),
             )
 
-            if "alert_message_id" in row_dict:
-                output["alert_message_id"] = row_dict["alert_message_id"]
+            return {
+                data["thread_id"]: data
+                for data in map(_make_inactive_help_thread_data, result.mappings())
+            }
 
-            return output
+    async def fetch_inactive_help_thread_data_or_none(
+        self, thread_id: int
+    ) -> InactiveHelpThreadData | None:
+        if thread_id not in self.inactive_help_thread_ids:
+            return None
+
+        try:
+            return await self.fetch_inactive_help_thread_data(thread_id)
+        except LookupError:
+            return None
 
     async def save_inactive_help_thread_data(
         self, data: InactiveHelpThreadData
     ) -> None:
-        target_columns = (
-            "thread_id",
-            "last_active_ts",
-            "alert_message_id",
-        )
-        target_update_set_columns = ", ".join((f"{k} = :{k}" for k in target_columns))
-
         conn: AsyncConnection
         async with self.db_engine.begin() as conn:
             await conn.execute(
-                text(
-                    "INSERT INTO "
-                    f"'{DB_PREFIX}inactive_help_thread_data' AS inactive_help_thread_data "
-                    f"({', '.join(target_columns)}) "
-                    f"VALUES ({', '.join(':'+colname for colname in target_columns)}) "
-                    f"ON CONFLICT DO UPDATE SET {target_update_set_columns} "
-                    "WHERE inactive_help_thread_data.thread_id == :thread_id "
-                ),
+                _SAVE_INACTIVE,
                 data | dict(alert_message_id=data.get("alert_message_id", None)),  # type: ignore
             )
+        self.inactive_help_thread_ids.add(data["thread_id"])
 
     async def delete_inactive_help_thread_data(self, thread_id: int) -> None:
         conn: AsyncConnection
-        async with self.db_engine.connect() as conn:
+        async with self.db_engine.begin() as conn:
             await conn.execute(
-                text(
-                    f"DELETE FROM '{DB_PREFIX}inactive_help_thread_data' "
-                    "AS inactive_help_thread_data "
-                    "WHERE inactive_help_thread_data.thread_id == :thread_id"
-                ),
+                _DEL_INACTIVE,
                 dict(thread_id=thread_id),
             )
+        self.inactive_help_thread_ids.discard(thread_id)
+
+    async def edit_help_thread(
+        self, thread: discord.Thread, **kwargs
+    ) -> discord.Thread:
+        """Edit a help thread, and remember the edited fields for a short while, so
+        that `on_thread_update` doesn't need to check the audit log for the update
+        caused by this edit.
+        """
+        now = time.monotonic()
+        for thread_id in [
+            thread_id
+            for thread_id, pending in self.self_edited_help_threads.items()
+            if pending[-1][0] <= now  # deadlines of later edits are never earlier
+        ]:
+            del self.self_edited_help_threads[thread_id]
+
+        pending_edit = (now + 10, kwargs)
+        self.self_edited_help_threads.setdefault(thread.id, []).append(pending_edit)
+        try:
+            return await thread.edit(**kwargs)
+        except discord.HTTPException:
+            if (pending := self.self_edited_help_threads.get(thread.id)) is not None:
+                if pending_edit in pending:
+                    pending.remove(pending_edit)
+                if not pending:
+                    del self.self_edited_help_threads[thread.id]
+            raise
+
+    def pop_self_edit(self, before: discord.Thread, after: discord.Thread) -> bool:
+        """Whether a thread update was caused by a pending edit made through
+        `edit_help_thread()`, which is forgotten if so. An edit only matches if it
+        set every changed field to its new value.
+        """
+        changes: dict[str, Any] = {
+            field: after_value
+            for field, before_value, after_value in (
+                ("name", before.name, after.name),
+                (
+                    "applied_tags",
+                    frozenset(tag.id for tag in before.applied_tags),
+                    frozenset(tag.id for tag in after.applied_tags),
+                ),
+                ("archived", before.archived, after.archived),
+                ("locked", before.locked, after.locked),
+                ("slowmode_delay", before.slowmode_delay, after.slowmode_delay),
+            )
+            if before_value != after_value
+        }
+        if not changes or not (pending := self.self_edited_help_threads.get(after.id)):
+            return False
+
+        now = time.monotonic()
+        for i, (deadline, edits) in enumerate(pending):
+            if deadline > now and all(
+                field in edits
+                and (
+                    frozenset(tag.id for tag in edits[field])
+                    if field == "applied_tags"
+                    else edits[field]
+                )
+                == value
+                for field, value in changes.items()
+            ):
+                del pending[i]
+                if not pending:
+                    del self.self_edited_help_threads[after.id]
+                return True
+
+        return False
+
+    async def fetch_help_thread_parent(
+        self, thread: discord.Thread
+    ) -> discord.ForumChannel:
+        """Get the parent forum channel of a help thread, falling back to a
+        briefly cached HTTP fetch if it isn't in the bot's channel cache.
+        """
+        if parent := thread.parent:
+            return parent  # type: ignore
+
+        return await self.fetch_help_forum_channel(thread.parent_id)
+
+    async def fetch_help_forum_channel(self, channel_id: int) -> discord.ForumChannel:
+        """Get a help forum channel, falling back to a briefly cached HTTP fetch if it
+        isn't in the bot's channel cache.
+        """
+        if channel := self.bot.get_channel(channel_id):
+            return channel  # type: ignore
+
+        now = time.monotonic()
+        if (
+            cached := self.fetched_help_forum_channels.get(channel_id)
+        ) is not None and cached[0] > now:
+            return cached[1]
+
+        fetched: discord.ForumChannel = await self.bot.fetch_channel(
+            channel_id
+        )  # type: ignore
+        self.fetched_help_forum_channels[channel_id] = (now + 300, fetched)
+        return fetched
+
+    def get_help_forum_channel_tag(
+        self, forum_channel: discord.ForumChannel, tag_flag: int
+    ) -> discord.ForumTag | None:
+        """Get the first available tag of a help forum channel that has the given
+        `_*_TAG` flag. Results are cached until the channel is updated.
+        """
+        channel_tags = self.help_forum_channel_tags.setdefault(forum_channel.id, {})
+        if tag_flag not in channel_tags:
+            channel_tags[tag_flag] = next(
+                (
+                    tag
+                    for tag in forum_channel.available_tags
+                    if _get_tag_flags(tag) & tag_flag
+                ),
+                None,
+            )
+
+        return channel_tags[tag_flag]
+
+    @staticmethod
+    async def delete_help_thread_messages(
+        thread: discord.Thread, message_ids: Iterable[int]
+    ) -> None:
+        """Delete the given messages of a help thread, ignoring ones that don't exist
+        anymore. Multiple messages are bulk deleted in batches of up to 100 if the
+        bot is allowed to do so.
+        """
+        messages = [thread.get_partial_message(msg_id) for msg_id in message_ids]
+        if (
+            len(messages) > 1
+            and thread.permissions_for(thread.guild.me).manage_messages
+        ):
+            remaining: list[discord.PartialMessage] = []
+            for i in range(0, len(messages), 100):
+                batch = messages[i : i + 100]
+                try:
+                    await thread.delete_messages(batch)
+                except (discord.ClientException, discord.Forbidden):
+                    remaining.extend(messages[i:])  # delete the rest one by one
+                    break
+                except discord.HTTPException:
+                    remaining.extend(batch)  # e.g. messages older than 14 days
+
+            messages = remaining
+
+        async def delete_message(message: discord.PartialMessage):
+            try:
+                await message.delete()
+            except discord.NotFound:
+                pass
+
+        await asyncio.gather(*(delete_message(message) for message in messages))
 
     @commands.Cog.listener()
     async def on_thread_create(self, thread: discord.Thread):
-        if thread.parent_id in HELP_FORUM_CHANNEL_IDS.values():
+        if thread.parent_id in HELP_FORUM_CHANNEL_IDS_SET:
             caution_messages: list[discord.Message] = []
             issues_found = False
             thread_edits = {}
@@ -248,29 +662,25 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                     else (await thread.fetch_message(thread.id))
                 ).pin()
 
-                parent = (
-                    thread.parent
-                    or self.bot.get_channel(thread.parent_id)
-                    or await self.bot.fetch_channel(thread.parent_id)
-                )
+                parent = await self.fetch_help_thread_parent(thread)
 
                 if (
                     len((applied_tags := thread.applied_tags)) < FORUM_THREAD_TAG_LIMIT
                     or len(applied_tags) == FORUM_THREAD_TAG_LIMIT
-                    and any(
-                        tag.name.lower().startswith("solved") for tag in applied_tags
-                    )
+                    and any(_get_tag_flags(tag) & _SOLVED_TAG for tag in applied_tags)
                 ):
                     new_tags = [
                         tag
                         for tag in applied_tags
-                        if not tag.name.lower().startswith(("solved", "abandoned"))
+                        if not _get_tag_flags(tag) & (_SOLVED_TAG | _ABANDONED_TAG)
                     ]
 
-                    for tag in parent.available_tags:  # type: ignore
-                        if tag.name.lower().startswith("unsolved"):
-                            new_tags.insert(0, tag)  # mark help post as unsolved
-                            break
+                    if (
+                        unsolved_tag := self.get_help_forum_channel_tag(
+                            parent, _UNSOLVED_TAG
+                        )
+                    ) is not None:
+                        new_tags.insert(0, unsolved_tag)  # mark help post as unsolved
 
                     thread_edits["applied_tags"] = new_tags
 
@@ -323,19 +733,16 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                     await self.save_bad_help_thread_data(
                         {
                             "thread_id": thread.id,
-                            "last_cautioned_ts": time.time(),
-                            "caution_message_ids": set(
-                                msg.id for msg in caution_messages
+                            "last_cautioned_ts": _get_last_cautioned_ts(
+                                caution_messages
                             ),
+                            "caution_message_ids": {msg.id for msg in caution_messages},
                         }
                     )
 
-                owner_id_long_suffix = f"│{thread.owner_id}"
-                owner_id_suffix = f"│{f'{thread.owner_id}'[-6:]}"
-                if not (
-                    thread.name.endswith((owner_id_long_suffix, owner_id_suffix))
-                    or str(thread.owner_id) in thread.name
-                ):
+                if (
+                    owner_id_suffix := _get_missing_owner_id_suffix(thread)
+                ) is not None:
                     thread_edits["name"] = (
                         thread.name
                         if len(thread.name) < 94
@@ -343,7 +750,7 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                     ) + owner_id_suffix
 
                 if thread_edits:
-                    await thread.edit(**thread_edits)
+                    await self.edit_help_thread(thread, **thread_edits)
 
             except discord.HTTPException:
                 pass
@@ -379,56 +786,30 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                 await self.caution_about_python_help_forum_channel_pygame_thread(thread)
             )
 
-        bad_help_thread_data_exists = await self.bad_help_thread_data_exists(thread.id)
-
-        if caution_message and bad_help_thread_data_exists:
-            await self.save_bad_help_thread_data(
-                (
-                    bad_thread_data := BadHelpThreadData(
-                        {
-                            "thread_id": thread.id,
-                            "last_cautioned_ts": time.time(),
-                            "caution_message_ids": set((caution_message.id,)),
-                        }
-                    )
+        if caution_message:
+            if await self.bad_help_thread_data_exists(thread.id):
+                await self.merge_bad_help_thread_data(
+                    {
+                        "thread_id": thread.id,
+                        "last_cautioned_ts": caution_message.created_at.timestamp(),
+                        "caution_message_ids": {caution_message.id},
+                    }
                 )
+        elif (not caution_types) and (
+            bad_thread_data := await self.fetch_bad_help_thread_data_or_none(thread.id)
+        ) is not None:  # delete caution messages
+            await self.delete_help_thread_messages(
+                thread, bad_thread_data["caution_message_ids"]
             )
 
-            bad_thread_data = bad_thread_data or await self.fetch_bad_help_thread_data(
-                thread.id
-            )
-
-            await self.save_bad_help_thread_data(
-                {
-                    "thread_id": thread.id,
-                    "last_cautioned_ts": time.time(),
-                    "caution_message_ids": bad_thread_data.get(
-                        "caution_message_ids", set()
-                    )
-                    | set((caution_message.id,)),
-                }
-            )
-        elif (
-            not caution_types
-        ) and bad_help_thread_data_exists:  # delete caution messages
-
-            bad_thread_data = await self.fetch_bad_help_thread_data(thread.id)
-
-            for msg_id in bad_thread_data["caution_message_ids"]:
-                try:
-                    await thread.get_partial_message(msg_id).delete()
-                except discord.NotFound:
-                    pass
-
             await self.delete_bad_help_thread_data(thread.id)
 
     @commands.Cog.listener()
     async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
-        if after.parent_id in HELP_FORUM_CHANNEL_IDS.values():
+        if after.parent_id in HELP_FORUM_CHANNEL_IDS_SET:
+            self_edited = self.pop_self_edit(before, after)
             try:
                 assert self.bot.user
-                owner_id_long_suffix = f"│{after.owner_id}"
-                owner_id_suffix = f"│{f'{after.owner_id}'[-6:]}"
                 if not (after.archived or after.locked):
                     thread_edits = {}
                     caution_messages: list[discord.Message] = []
@@ -437,13 +818,19 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
 
                     updater_id = None
 
-                    async for action in after.guild.audit_logs(
-                        limit=20, action=discord.AuditLogAction.thread_update
-                    ):
-                        if (target := action.target) and target.id == after.id:
-                            if action.user:
-                                updater_id = action.user.id
-                                break
+                    if self_edited:
+                        updater_id = self.bot.user.id
+                    elif (
+                        before.name != after.name
+                        or before.applied_tags != after.applied_tags
+                    ):  # only these changes depend on who made them
+                        async for action in after.guild.audit_logs(
+                            limit=20, action=discord.AuditLogAction.thread_update
+                        ):
+                            if (target := action.target) and target.id == after.id:
+                                if action.user:
+                                    updater_id = action.user.id
+                                    break
 
                     if before.name != after.name and updater_id != self.bot.user.id:  # type: ignore
                         if caution_types := self.get_help_forum_channel_thread_cautions(
@@ -460,8 +847,9 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                                     ),
                                 )
                             )
+                            title_too_short = "thread_title_too_short" in caution_types
                             if (
-                                "thread_title_too_short" in caution_types
+                                title_too_short
                                 and after.slowmode_delay
                                 < THREAD_TITLE_TOO_SHORT_SLOWMODE_DELAY
                             ):
@@ -473,19 +861,15 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                                     )
                                 )
                             elif (
-                                "thread_title_too_short" not in caution_types
+                                not title_too_short
                                 and after.slowmode_delay
                                 == THREAD_TITLE_TOO_SHORT_SLOWMODE_DELAY
                             ):
                                 thread_edits.update(
                                     dict(
                                         slowmode_delay=(
-                                            after.parent
-                                            or self.bot.get_channel(after.parent_id)
-                                            or await self.bot.fetch_channel(
-                                                after.parent_id
-                                            )
-                                        ).default_thread_slowmode_delay,  # type: ignore
+                                            await self.fetch_help_thread_parent(after)
+                                        ).default_thread_slowmode_delay,
                                         reason="This help post's title is not too short anymore.",
                                     )
                                 )
@@ -515,41 +899,26 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                     #             )
 
                     if bad_thread_name_or_starter_message or bad_thread_tags:
-                        bad_thread_data = None
-                        if not await self.bad_help_thread_data_exists(after.id):
-                            await self.save_bad_help_thread_data(
-                                (
-                                    bad_thread_data := BadHelpThreadData(
-                                        {
-                                            "thread_id": after.id,
-                                            "last_cautioned_ts": time.time(),
-                                            "caution_message_ids": set(
-                                                msg.id for msg in caution_messages
-                                            ),
-                                        }
-                                    )
-                                )
-                            )
-
-                        bad_thread_data = (
-                            bad_thread_data
-                            or await self.fetch_bad_help_thread_data(after.id)
-                        )
-
-                        await self.save_bad_help_thread_data(
+                        await self.merge_bad_help_thread_data(
                             {
                                 "thread_id": after.id,
-                                "last_cautioned_ts": time.time(),
-                                "caution_message_ids": bad_thread_data.get(
-                                    "caution_message_ids", set()
-                                )
-                                | set(msg.id for msg in caution_messages),
+                                "last_cautioned_ts": _get_last_cautioned_ts(
+                                    caution_messages
+                                ),
+                                "caution_message_ids": {
+                                    msg.id for msg in caution_messages
+                                },
                             }
                         )
                     else:
                         if (
-                            await self.bad_help_thread_data_exists(after.id)
-                            and updater_id != self.bot.user.id
+                            updater_id != self.bot.user.id
+                            and (
+                                bad_thread_data := await self.fetch_bad_help_thread_data_or_none(
+                                    after.id
+                                )
+                            )
+                            is not None
                         ) and not (
                             caution_types := self.get_help_forum_channel_thread_cautions(
                                 after
@@ -568,43 +937,32 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                                 thread_edits.update(
                                     dict(
                                         slowmode_delay=(
-                                            after.parent
-                                            or self.bot.get_channel(after.parent_id)
-                                            or await self.bot.fetch_channel(
-                                                after.parent_id
-                                            )
-                                        ).default_thread_slowmode_delay,  # type: ignore
+                                            await self.fetch_help_thread_parent(after)
+                                        ).default_thread_slowmode_delay,
                                         reason="This help post's title is not invalid anymore.",
                                     )
                                 )
 
-                            bad_thread_data = await self.fetch_bad_help_thread_data(
-                                after.id
+                            await self.delete_help_thread_messages(
+                                after, bad_thread_data["caution_message_ids"]
                             )
 
-                            for msg_id in bad_thread_data["caution_message_ids"]:
-                                try:
-                                    await after.get_partial_message(msg_id).delete()
-                                except discord.NotFound:
-                                    pass
-
                             await self.delete_bad_help_thread_data(after.id)
 
                         solved_in_before = any(
-                            tag.name.lower().startswith("solved")
+                            _get_tag_flags(tag) & _SOLVED_TAG
                             for tag in before.applied_tags
                         )
                         solved_in_after = any(
-                            tag.name.lower().startswith("solved")
+                            _get_tag_flags(tag) & _SOLVED_TAG
                             for tag in after.applied_tags
                         )
                         if not solved_in_before and solved_in_after:
                             new_tags = [
                                 tag
                                 for tag in after.applied_tags
-                                if not tag.name.lower().startswith(
-                                    ("unsolved", "abandoned")
-                                )
+                                if not _get_tag_flags(tag)
+                                & (_UNSOLVED_TAG | _ABANDONED_TAG)
                             ]
                             await self.send_help_thread_solved_alert(after)
                             thread_edits.update(
@@ -615,10 +973,11 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                                 )
                             )
 
-                            if await self.inactive_help_thread_data_exists(after.id):
-                                inactive_thread_data = (
-                                    await self.fetch_inactive_help_thread_data(after.id)
+                            if (
+                                inactive_thread_data := await self.fetch_inactive_help_thread_data_or_none(
+                                    after.id
                                 )
+                            ) is not None:
                                 try:
                                     if alert_message_id := inactive_thread_data.get(
                                         "alert_message_id", None
@@ -643,20 +1002,18 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                                     await message.delete()
                                     break
 
-                            parent = (
-                                after.parent
-                                or self.bot.get_channel(after.parent_id)
-                                or await self.bot.fetch_channel(after.parent_id)
-                            )  # type: ignore
+                            parent = await self.fetch_help_thread_parent(after)
 
                             new_tags = after.applied_tags
                             if len(new_tags) < FORUM_THREAD_TAG_LIMIT:
-                                for tag in parent.available_tags:
-                                    if tag.name.lower().startswith("unsolved"):
-                                        new_tags.insert(
-                                            0, tag
-                                        )  # mark help post as unsolved
-                                        break
+                                if (
+                                    unsolved_tag := self.get_help_forum_channel_tag(
+                                        parent, _UNSOLVED_TAG
+                                    )
+                                ) is not None:
+                                    new_tags.insert(
+                                        0, unsolved_tag
+                                    )  # mark help post as unsolved
 
                             slowmode_delay = discord.utils.MISSING
                             if (
@@ -675,34 +1032,27 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
 
                     if thread_edits:
                         await asyncio.sleep(5)
-                        await after.edit(
-                            **thread_edits
+                        await self.edit_help_thread(
+                            after, **thread_edits
                         )  # apply edits in a batch to save API calls
 
                 elif (
                     after.archived
                     and not after.locked
                     and any(
-                        tag.name.lower().startswith("solved")
-                        for tag in after.applied_tags
+                        _get_tag_flags(tag) & _SOLVED_TAG for tag in after.applied_tags
                     )
                 ):
                     thread_edits = {}
-                    parent: discord.ForumChannel = (
-                        after.parent
-                        or self.bot.get_channel(after.parent_id)
-                        or await self.bot.fetch_channel(after.parent_id)
-                    )  # type: ignore
+                    parent = await self.fetch_help_thread_parent(after)
                     if (
                         after.slowmode_delay == parent.default_thread_slowmode_delay
                     ):  # no custom slowmode override
                         thread_edits["slowmode_delay"] = 60
 
-                    if not (
-                        after.name.endswith((owner_id_long_suffix, owner_id_suffix))
-                        or str(after.owner_id) in after.name
-                    ):  # wait for a few event loop iterations, before doing a second,
-                        # check, to be sure that a bot edit hasn't already occured
+                    if (
+                        owner_id_suffix := _get_missing_owner_id_suffix(after)
+                    ) is not None:
                         thread_edits["name"] = (
                             after.name
                             if len(after.name) < 94
@@ -710,40 +1060,48 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                         ) + owner_id_suffix
 
                     if thread_edits:
-                        await after.edit(archived=False)
-                        await asyncio.sleep(5)
-                        thread_edits["archived"] = True
-                        await after.edit(**thread_edits)
+                        # archived threads can only be modified while unarchiving
+                        # them, so the edits are applied together with that
+                        thread_edits["archived"] = False
+                        await self.edit_help_thread(after, **thread_edits)
+                        await self.edit_help_thread(after, archived=True)
 
                 elif (
                     before.archived
                     and not after.archived
                     and any(
-                        tag.name.lower().startswith("abandoned")
+                        _get_tag_flags(tag) & _ABANDONED_TAG
                         for tag in after.applied_tags
                     )
                 ):
-                    parent = (
-                        after.parent
-                        or self.bot.get_channel(after.parent_id)
-                        or await self.bot.fetch_channel(after.parent_id)
-                    )  # type: ignore
+                    parent = await self.fetch_help_thread_parent(after)
 
                     new_tags = [
                         tag
                         for tag in after.applied_tags
-                        if not tag.name.lower().startswith("abandoned")
+                        if not _get_tag_flags(tag) & _ABANDONED_TAG
                     ]
-                    for tag in parent.available_tags:
-                        if tag.name.lower().startswith("unsolved"):
-                            new_tags.insert(0, tag)  # mark help post as unsolved again
-                            break
+                    if (
+                        unsolved_tag := self.get_help_forum_channel_tag(
+                            parent, _UNSOLVED_TAG
+                        )
+                    ) is not None:
+                        # mark help post as unsolved again
+                        new_tags.insert(0, unsolved_tag)
 
-                    await after.edit(applied_tags=new_tags)
+                    await self.edit_help_thread(after, applied_tags=new_tags)
 
             except discord.HTTPException:
                 pass
 
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ):
+        if after.id in HELP_FORUM_CHANNEL_IDS_SET:
+            # available tags might have changed
+            self.help_forum_channel_tags.pop(after.id, None)
+
     @commands.Cog.listener()
     async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
         if await self.inactive_help_thread_data_exists(payload.thread_id):
@@ -758,9 +1116,8 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
             if not isinstance(forum_channel, discord.ForumChannel):
                 return
 
-            for help_thread in itertools.chain(
-                forum_channel.threads,
-                [thr async for thr in forum_channel.archived_threads(limit=20)],
+            async for help_thread in self.iter_help_forum_channel_threads(
+                forum_channel, archived_limit=20
             ):
                 if help_thread.owner_id == payload.user.id:
                     snakecore.utils.hold_task(
@@ -779,7 +1136,7 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
         cached_message = payload.cached_message
         if (
             cached_message
-            and cached_message.channel.id not in HELP_FORUM_CHANNEL_IDS.values()
+            and cached_message.channel.id not in HELP_FORUM_CHANNEL_IDS_SET
         ):
             return
 
@@ -795,7 +1152,7 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
 
         if not (
             isinstance(thread, discord.Thread)
-            and thread.parent_id in HELP_FORUM_CHANNEL_IDS.values()
+            and thread.parent_id in HELP_FORUM_CHANNEL_IDS_SET
             and thread.id == payload.message_id
         ):
             return
@@ -811,7 +1168,10 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         try:
-            if not snakecore.utils.is_emoji_equal(payload.emoji, "✅"):
+            if not (
+                payload.emoji.is_unicode_emoji()
+                and payload.emoji.name == _WHITE_CHECK_MARK
+            ):
                 return
 
             channel = self.bot.get_channel(
@@ -822,15 +1182,9 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
 
             msg = await channel.fetch_message(payload.message_id)
             if (
-                channel.parent_id in HELP_FORUM_CHANNEL_IDS.values()
+                channel.parent_id in HELP_FORUM_CHANNEL_IDS_SET
                 and not channel.flags.pinned
             ):
-                white_check_mark_reaction = discord.utils.find(
-                    lambda r: isinstance(r.emoji, discord.PartialEmoji)
-                    and snakecore.utils.is_emoji_equal(r.emoji, "✅"),
-                    msg.reactions,
-                )
-
                 by_op = payload.user_id == channel.owner_id
 
                 by_admin = (
@@ -848,7 +1202,8 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                     await msg.remove_reaction("✅", msg.author)
 
                 elif not msg.pinned and (
-                    white_check_mark_reaction and white_check_mark_reaction.count >= 4
+                    (white_check_mark_reaction := _get_white_check_mark_reaction(msg))
+                    and white_check_mark_reaction.count >= 4
                 ):
                     await msg.pin(
                         reason="Multiple members of this message's thread "
@@ -881,30 +1236,29 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                 ) and len(
                     channel.applied_tags
                 ) < FORUM_THREAD_TAG_LIMIT:  # help post should be marked as solved
-                    for tag in (
-                        channel.parent
-                        or self.bot.get_channel(channel.parent_id)
-                        or await self.bot.fetch_channel(channel.parent_id)
-                    ).available_tags:  # type: ignore
-                        if tag.name.lower().startswith("solved"):
-                            new_tags = [
-                                tg
-                                for tg in channel.applied_tags
-                                if tg.name.lower() not in ("unsolved", "abandoned")
-                            ]
-                            new_tags.append(tag)
-
-                            await channel.edit(
-                                reason="This help post was marked as solved by "
-                                + (
-                                    "the OP"
-                                    if by_op
-                                    else "an admin" if by_admin else "a Helpfulie"
-                                )
-                                + " (via adding a ✅ reaction).",
-                                applied_tags=new_tags,
+                    if (
+                        solved_tag := self.get_help_forum_channel_tag(
+                            await self.fetch_help_thread_parent(channel), _SOLVED_TAG
+                        )
+                    ) is not None:
+                        new_tags = [
+                            tg
+                            for tg in channel.applied_tags
+                            if tg.name.lower() not in ("unsolved", "abandoned")
+                        ]
+                        new_tags.append(solved_tag)
+
+                        await self.edit_help_thread(
+                            channel,
+                            reason="This help post was marked as solved by "
+                            + (
+                                "the OP"
+                                if by_op
+                                else "an admin" if by_admin else "a Helpfulie"
                             )
-                            break
+                            + " (via adding a ✅ reaction).",
+                            applied_tags=new_tags,
+                        )
 
         except discord.HTTPException:
             pass
@@ -912,7 +1266,10 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
         try:
-            if not snakecore.utils.is_emoji_equal(payload.emoji, "✅"):
+            if not (
+                payload.emoji.is_unicode_emoji()
+                and payload.emoji.name == _WHITE_CHECK_MARK
+            ):
                 return
 
             channel = self.bot.get_channel(
@@ -924,31 +1281,21 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
             msg = await channel.fetch_message(payload.message_id)
             if (
                 isinstance(msg.channel, discord.Thread)
-                and msg.channel.parent_id in HELP_FORUM_CHANNEL_IDS.values()
+                and msg.channel.parent_id in HELP_FORUM_CHANNEL_IDS_SET
             ):
-                if not snakecore.utils.is_emoji_equal(payload.emoji, "✅"):
-                    return
-
-                white_check_mark_reaction = discord.utils.find(
-                    lambda r: isinstance(r.emoji, discord.PartialEmoji)
-                    and snakecore.utils.is_emoji_equal(r.emoji, "✅"),
-                    msg.reactions,
-                )
-
                 by_op = payload.user_id == channel.owner_id
                 by_admin = (
                     payload.member and payload.member.guild_permissions.administrator
                 )
 
                 if msg.pinned and (
-                    (
-                        not white_check_mark_reaction
-                        or white_check_mark_reaction
-                        and (
-                            white_check_mark_reaction.count < 4
-                            or white_check_mark_reaction.count < 2
-                            and by_admin
-                        )
+                    not (
+                        white_check_mark_reaction := _get_white_check_mark_reaction(msg)
+                    )
+                    or (
+                        white_check_mark_reaction.count < 4
+                        or white_check_mark_reaction.count < 2
+                        and by_admin
                     )
                 ):
                     await msg.unpin(
@@ -971,289 +1318,318 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
                     )
                     and msg.channel.applied_tags
                     and any(
-                        tag.name.lower().startswith("solved")
+                        _get_tag_flags(tag) & _SOLVED_TAG
                         for tag in msg.channel.applied_tags
                     )
                 ):  # help post should be unmarked as solved
-                    for tag in (
-                        msg.channel.parent
-                        or self.bot.get_channel(msg.channel.parent_id)
-                        or await self.bot.fetch_channel(msg.channel.parent_id)
-                    ).available_tags:  # type: ignore
-                        if tag.name.lower().startswith("solved"):
-                            await msg.channel.remove_tags(
-                                tag,
-                                reason="This help post was unmarked as solved by "
-                                + (
-                                    "the OP"
-                                    if by_op
-                                    else "an admin" if by_admin else "a Helpfulie"
-                                )
-                                + " (via removing a ✅ reaction).",
+                    if (
+                        solved_tag := self.get_help_forum_channel_tag(
+                            await self.fetch_help_thread_parent(
+                                msg.channel  # type: ignore
+                            ),
+                            _SOLVED_TAG,
+                        )
+                    ) is not None:
+                        await self.edit_help_thread(
+                            msg.channel,  # type: ignore
+                            applied_tags=[
+                                tag
+                                for tag in msg.channel.applied_tags
+                                if tag != solved_tag
+                            ],
+                            reason="This help post was unmarked as solved by "
+                            + (
+                                "the OP"
+                                if by_op
+                                else "an admin" if by_admin else "a Helpfulie"
                             )
-                            break
+                            + " (via removing a ✅ reaction).",
+                        )
         except discord.HTTPException:
             pass
 
     @tasks.loop(hours=1, reconnect=True)
-    async def inactive_help_thread_alert(self):
-        for forum_channel in [
-            self.bot.get_channel(fid) or (await self.bot.fetch_channel(fid))
-            for fid in HELP_FORUM_CHANNEL_IDS.values()
-        ]:
+    async def help_thread_maintenance(self):
+        for fid in HELP_FORUM_CHANNEL_IDS.values():
+            forum_channel = await self.fetch_help_forum_channel(fid)
             if not isinstance(forum_channel, discord.ForumChannel):
-                return
+                continue
 
-            now_ts = time.time()
-            for help_thread in itertools.chain(
-                forum_channel.threads,
-                [thr async for thr in forum_channel.archived_threads(limit=20)],
+            for maintenance_pass in (
+                self.inactive_help_thread_alert,
+                self.force_help_thread_archive_after_timeout,
+                self.tag_inactive_help_threads_as_abandoned,
             ):
                 try:
-                    if not help_thread.created_at:
-                        continue
-                    last_active_ts = help_thread.created_at.timestamp()
-
-                    if not (
-                        help_thread.locked
-                        or help_thread.flags.pinned
-                        or any(
-                            tag.name.lower().startswith("solved")
-                            for tag in help_thread.applied_tags
-                        )
-                    ):
-                        last_active_ts = (
-                            await self.fetch_last_thread_activity_dt(help_thread)
-                        ).timestamp()
-
-                        if (now_ts - last_active_ts) > (3600 * 23 + 1800):  # 23h30m
-                            if (
-                                not await self.inactive_help_thread_data_exists(
-                                    help_thread.id
-                                )
-                            ) or (
-                                inactive_thread_data := await self.fetch_inactive_help_thread_data(
-                                    help_thread.id
-                                )
-                            )[
-                                "last_active_ts"
-                            ] < last_active_ts:
-                                if not (
-                                    help_thread.archived
-                                    and help_thread.archiver_id
-                                    and (
-                                        help_thread.archiver_id == help_thread.owner_id
-                                        or forum_channel.permissions_for(
-                                            help_thread.guild.get_member(
-                                                help_thread.archiver_id
-                                            )
-                                            or await help_thread.guild.fetch_member(
-                                                help_thread.archiver_id
-                                            )
-                                        ).manage_threads
-                                    )  # allow alert supression by help thread owner/OP or forum channel moderator
-                                ):
-                                    alert_message = None
-                                    async for message in help_thread.history(limit=20):
-                                        if (
-                                            message.author.id != self.bot.user.id  # type: ignore
-                                            and not message.is_system()
-                                        ):
-                                            break
-
-                                        if message.content.startswith(
-                                            "help-post-inactive"
-                                        ):  # find previous alert message, if it exists
-                                            alert_message = message
-                                            break
-
-                                    if not alert_message:
-                                        alert_message = await help_thread.send(
-                                            f"help-post-inactive(<@{help_thread.owner_id}>, **{help_thread.name}**)",
-                                            embed=discord.Embed(
-                                                title="Your help post has gone inactive... 💤",
-                                                description=f"Your help post was last active **<t:{int(last_active_ts)}:R>** ."
-                                                "\nHas your issue been solved? If so, mark it as **Solved** by "
-                                                "doing one of these:\n\n"
-                                                "  **• React on your starter message with ✅**.\n"
-                                                f"> *Note: <@&{HELPFULIE_ROLE_ID}>s can do this too!*\n\n"
-                                                "  **• Right-click on your post (click and hold on mobile), "
-                                                "go to 'Edit Tags', select the `✅ Solved` tag and save your changes.**\n\n"
-                                                "**Mark all messages you find helpful here with a ✅ reaction please** "
-                                                "<:pg_robot:837389387024957440>\n\n"
-                                                "*If your issue has't been solved, you may "
-                                                "either wait for help or close this post.*",
-                                                color=0x888888,
-                                            ),
-                                        )
-                                    await self.save_inactive_help_thread_data(
-                                        {
-                                            "thread_id": help_thread.id,
-                                            "last_active_ts": alert_message.created_at.timestamp(),
-                                            "alert_message_id": alert_message.id,
-                                        }
-                                    )
-                        elif (
-                            await self.inactive_help_thread_data_exists(help_thread.id)
-                            and (
-                                alert_message_id := (
-                                    inactive_thread_data := await self.fetch_inactive_help_thread_data(
-                                        help_thread.id
-                                    )
-                                ).get("alert_message_id", None)
-                            )
-                        ) and (
-                            (
-                                partial_alert_message := help_thread.get_partial_message(
-                                    alert_message_id
-                                )
-                            ).created_at.timestamp()
-                            < last_active_ts  # someone messaged into the thread, prepare to delete alert message
-                        ):
-                            try:
-                                last_message = await self.fetch_last_thread_message(
-                                    help_thread
-                                )
-                                if last_message and not last_message.is_system():
-                                    try:
-                                        await partial_alert_message.delete()
-                                    except discord.NotFound:
-                                        pass
-                                    finally:
-                                        await self.save_inactive_help_thread_data(
-                                            {
-                                                "thread_id": help_thread.id,
-                                                "last_active_ts": last_message.created_at.timestamp(),
-                                                # erase alert_message_id by omitting it
-                                            }
-                                        )
-                            except discord.NotFound:
-                                pass
-
+                    await maintenance_pass(forum_channel)
                 except discord.HTTPException:
                     pass
 
-    @tasks.loop(hours=1, reconnect=True)
-    async def force_help_thread_archive_after_timeout(self):
-        for forum_channel in [
-            self.bot.get_channel(fid) or (await self.bot.fetch_channel(fid))
-            for fid in HELP_FORUM_CHANNEL_IDS.values()
-        ]:
-            if not isinstance(forum_channel, discord.ForumChannel):
-                return
+    async def inactive_help_thread_alert(self, forum_channel: discord.ForumChannel):
+        now_ts = time.time()
+        help_threads = [
+            *forum_channel.threads,
+            *[thr async for thr in forum_channel.archived_threads(limit=20)],
+        ]
+        inactive_thread_data_batch = await self.fetch_inactive_help_thread_data_batch(
+            help_thread.id for help_thread in help_threads
+        )
+        # member ID -> pending fetch, so that members archiving multiple help threads
+        # are only fetched once while the threads are processed concurrently
+        member_fetches: dict[int, asyncio.Task[discord.Member]] = {}
+
+        async def fetch_member(member_id: int) -> discord.Member:
+            if (member := forum_channel.guild.get_member(member_id)) is not None:
+                return member
 
-            now_ts = time.time()
-            for help_thread in forum_channel.threads:
-                if help_thread.created_at and not (
-                    help_thread.archived
-                    or help_thread.locked
+            if member_id not in member_fetches:
+                member_fetches[member_id] = asyncio.create_task(
+                    forum_channel.guild.fetch_member(member_id)
+                )
+
+            return await member_fetches[member_id]
+
+        async def alert_help_thread(help_thread: discord.Thread):
+            try:
+                if not help_thread.created_at:
+                    return
+                last_active_ts = help_thread.created_at.timestamp()
+
+                if not (
+                    help_thread.locked
                     or help_thread.flags.pinned
+                    or any(
+                        _get_tag_flags(tag) & _SOLVED_TAG
+                        for tag in help_thread.applied_tags
+                    )
                 ):
-                    try:
-                        last_active_ts = (
-                            await self.fetch_last_thread_activity_dt(help_thread)
-                        ).timestamp()
-                        if (
-                            now_ts - last_active_ts
-                        ) / 60.0 > help_thread.auto_archive_duration:
-                            thread_edits = {}
-                            thread_edits["archived"] = True
+                    if (
+                        last_message := await self.fetch_last_thread_message(
+                            help_thread
+                        )
+                    ) is not None:
+                        last_active_ts = last_message.created_at.timestamp()
 
-                            if (
-                                any(
-                                    tag.name.lower().startswith("solved")
-                                    for tag in help_thread.applied_tags
-                                )
-                                and help_thread.slowmode_delay
-                                == forum_channel.default_thread_slowmode_delay
+                    if (now_ts - last_active_ts) > (3600 * 23 + 1800):  # 23h30m
+                        if (
+                            inactive_thread_data := inactive_thread_data_batch.get(
+                                help_thread.id
+                            )
+                        ) is None or inactive_thread_data[
+                            "last_active_ts"
+                        ] < last_active_ts:
+                            if not (
+                                help_thread.archived
+                                and help_thread.archiver_id
+                                and (
+                                    help_thread.archiver_id == help_thread.owner_id
+                                    or forum_channel.permissions_for(
+                                        await fetch_member(help_thread.archiver_id)
+                                    ).manage_threads
+                                )  # allow alert supression by help thread owner/OP or forum channel moderator
                             ):
-                                # solved and no overridden slowmode
-                                thread_edits["slowmode_delay"] = 60  # seconds
+                                alert_message = None
+                                async for message in help_thread.history(limit=20):
+                                    if (
+                                        message.author.id != self.bot.user.id  # type: ignore
+                                        and not message.is_system()
+                                    ):
+                                        break
 
-                            if not (
-                                help_thread.name.endswith(
-                                    (
-                                        owner_id_long_suffix := f"│{help_thread.owner_id}",
-                                        owner_id_suffix := f"│{f'{help_thread.owner_id}'[-6:]}",
+                                    if message.content.startswith(
+                                        "help-post-inactive"
+                                    ):  # find previous alert message, if it exists
+                                        alert_message = message
+                                        break
+
+                                if not alert_message:
+                                    alert_message = await help_thread.send(
+                                        f"help-post-inactive(<@{help_thread.owner_id}>, **{help_thread.name}**)",
+                                        embed=discord.Embed(
+                                            title="Your help post has gone inactive... 💤",
+                                            description=f"Your help post was last active **<t:{int(last_active_ts)}:R>** ."
+                                            "\nHas your issue been solved? If so, mark it as **Solved** by "
+                                            "doing one of these:\n\n"
+                                            "  **• React on your starter message with ✅**.\n"
+                                            f"> *Note: <@&{HELPFULIE_ROLE_ID}>s can do this too!*\n\n"
+                                            "  **• Right-click on your post (click and hold on mobile), "
+                                            "go to 'Edit Tags', select the `✅ Solved` tag and save your changes.**\n\n"
+                                            "**Mark all messages you find helpful here with a ✅ reaction please** "
+                                            "<:pg_robot:837389387024957440>\n\n"
+                                            "*If your issue has't been solved, you may "
+                                            "either wait for help or close this post.*",
+                                            color=0x888888,
+                                        ),
                                     )
+                                await self.save_inactive_help_thread_data(
+                                    {
+                                        "thread_id": help_thread.id,
+                                        "last_active_ts": alert_message.created_at.timestamp(),
+                                        "alert_message_id": alert_message.id,
+                                    }
                                 )
-                                or str(help_thread.owner_id) in help_thread.name
-                            ):
-                                thread_edits["name"] = (
-                                    help_thread.name
-                                    if len(help_thread.name) < 94
-                                    else help_thread.name[:91] + "..."
-                                ) + owner_id_suffix
-
-                            await help_thread.edit(
-                                reason="This help thread has been closed "
-                                "after exceeding its inactivity timeout.",
-                                **thread_edits,
+                    elif (
+                        (
+                            inactive_thread_data := inactive_thread_data_batch.get(
+                                help_thread.id
+                            )
+                        )
+                        is not None
+                        and (
+                            alert_message_id := inactive_thread_data.get(
+                                "alert_message_id", None
+                            )
+                        )
+                    ) and (
+                        (
+                            partial_alert_message := help_thread.get_partial_message(
+                                alert_message_id
                             )
-                    except discord.HTTPException:
-                        pass
+                        ).created_at.timestamp()
+                        < last_active_ts  # someone messaged into the thread, prepare to delete alert message
+                    ):
+                        if last_message and not last_message.is_system():
+                            try:
+                                await partial_alert_message.delete()
+                            except discord.NotFound:
+                                pass
+                            finally:
+                                await self.save_inactive_help_thread_data(
+                                    {
+                                        "thread_id": help_thread.id,
+                                        "last_active_ts": last_message.created_at.timestamp(),
+                                        # erase alert_message_id by omitting it
+                                    }
+                                )
 
-    @tasks.loop(hours=1, reconnect=True)
-    async def tag_inactive_help_threads_as_abandoned(self):
-        for forum_channel in [
-            self.bot.get_channel(fid) or (await self.bot.fetch_channel(fid))
-            for fid in HELP_FORUM_CHANNEL_IDS.values()
-        ]:
-            if not isinstance(forum_channel, discord.ForumChannel):
-                return
+            except discord.HTTPException:
+                pass
 
-            now_ts = time.time()
-            try:
-                for help_thread in itertools.chain(
-                    forum_channel.threads,  # type: ignore
-                    [thr async for thr in forum_channel.archived_threads(limit=1000)],  # type: ignore
-                ):
+        await _gather_limited(
+            _HELP_THREAD_CONCURRENCY_LIMIT, map(alert_help_thread, help_threads)
+        )
+
+    async def force_help_thread_archive_after_timeout(
+        self, forum_channel: discord.ForumChannel
+    ):
+        now_ts = time.time()
+
+        async def archive_help_thread(help_thread: discord.Thread):
+            if help_thread.created_at and not (
+                help_thread.archived or help_thread.locked or help_thread.flags.pinned
+            ):
+                try:
+                    last_active_ts = (
+                        await self.fetch_last_thread_activity_dt(help_thread)
+                    ).timestamp()
                     if (
-                        help_thread.created_at
-                        and not (help_thread.locked or help_thread.flags.pinned)
-                        and (
+                        now_ts - last_active_ts
+                    ) / 60.0 > help_thread.auto_archive_duration:
+                        thread_edits = {}
+                        thread_edits["archived"] = True
+
+                        if (
                             any(
-                                tag.name.lower().startswith("unsolved")
-                                for tag in help_thread.applied_tags
-                            )
-                            or all(
-                                not tag.name.lower().startswith(
-                                    ("unsolved", "solved", "abandoned")
-                                )
+                                _get_tag_flags(tag) & _SOLVED_TAG
                                 for tag in help_thread.applied_tags
                             )
-                        )
-                    ):
-                        last_active_ts = (
-                            await self.fetch_last_thread_activity_dt(help_thread)
-                        ).timestamp()
+                            and help_thread.slowmode_delay
+                            == forum_channel.default_thread_slowmode_delay
+                        ):
+                            # solved and no overridden slowmode
+                            thread_edits["slowmode_delay"] = 60  # seconds
+
                         if (
-                            now_ts - last_active_ts
-                        ) > 86400 * 28:  # 4 weeks of inactivity
-                            thread_edits = {}
-                            thread_edits["archived"] = True
-                            thread_edits["applied_tags"] = [
-                                tag  # exclude unsolved tag
-                                for tag in help_thread.applied_tags
-                                if not tag.name.lower().startswith("unsolved")
-                            ]
-                            for tag in forum_channel.available_tags:
-                                if tag.name.lower().startswith("abandoned"):
-                                    thread_edits["applied_tags"].insert(0, tag)
-                                    break
+                            owner_id_suffix := _get_missing_owner_id_suffix(help_thread)
+                        ) is not None:
+                            thread_edits["name"] = (
+                                help_thread.name
+                                if len(help_thread.name) < 94
+                                else help_thread.name[:91] + "..."
+                            ) + owner_id_suffix
+
+                        await self.edit_help_thread(
+                            help_thread,
+                            reason="This help thread has been closed "
+                            "after exceeding its inactivity timeout.",
+                            **thread_edits,
+                        )
+                except discord.HTTPException:
+                    pass
+
+        await _gather_limited(
+            _HELP_THREAD_CONCURRENCY_LIMIT,
+            map(archive_help_thread, forum_channel.threads),
+        )
 
-                            if help_thread.archived:
-                                await help_thread.edit(
-                                    archived=False
-                                )  # archived threads can't be modified
-                                await asyncio.sleep(5)
-                            await help_thread.edit(
-                                reason="This help thread has been marked "
-                                "as abandoned after 28 days.",
-                                **thread_edits,
+    async def tag_inactive_help_threads_as_abandoned(
+        self, forum_channel: discord.ForumChannel
+    ):
+        now_ts = time.time()
+        try:
+            async for help_thread in self.iter_help_forum_channel_threads(
+                forum_channel, archived_limit=1000
+            ):
+                if (
+                    help_thread.created_at
+                    and not (help_thread.locked or help_thread.flags.pinned)
+                    and (
+                        any(
+                            _get_tag_flags(tag) & _UNSOLVED_TAG
+                            for tag in help_thread.applied_tags
+                        )
+                        or all(
+                            not _get_tag_flags(tag)
+                            & (_UNSOLVED_TAG | _SOLVED_TAG | _ABANDONED_TAG)
+                            for tag in help_thread.applied_tags
+                        )
+                    )
+                ):
+                    last_active_ts = (
+                        await self.fetch_last_thread_activity_dt(help_thread)
+                    ).timestamp()
+                    if (now_ts - last_active_ts) > 86400 * 28:  # 4 weeks of inactivity
+                        thread_edits = {}
+                        thread_edits["archived"] = True
+                        thread_edits["applied_tags"] = [
+                            tag  # exclude unsolved tag
+                            for tag in help_thread.applied_tags
+                            if not _get_tag_flags(tag) & _UNSOLVED_TAG
+                        ]
+                        if (
+                            abandoned_tag := self.get_help_forum_channel_tag(
+                                forum_channel, _ABANDONED_TAG
                             )
-            except discord.HTTPException:
-                pass
+                        ) is not None:
+                            thread_edits["applied_tags"].insert(0, abandoned_tag)
+
+                        if help_thread.archived:
+                            await self.edit_help_thread(
+                                help_thread, archived=False
+                            )  # archived threads can't be modified
+                            await asyncio.sleep(5)
+                        await self.edit_help_thread(
+                            help_thread,
+                            reason="This help thread has been marked "
+                            "as abandoned after 28 days.",
+                            **thread_edits,
+                        )
+        except discord.HTTPException:
+            pass
+
+    @staticmethod
+    async def iter_help_forum_channel_threads(
+        forum_channel: discord.ForumChannel, archived_limit: int | None = None
+    ) -> AsyncIterator[discord.Thread]:
+        """Iterate over the active threads of a forum channel, followed by its most
+        recently archived ones. Archived threads are fetched lazily, so that work on
+        active threads can begin before the first page of them arrives.
+        """
+        for thread in forum_channel.threads:
+            yield thread
+
+        async for thread in forum_channel.archived_threads(limit=archived_limit):
+            yield thread
 
     @staticmethod
     async def count_thread_messages(
@@ -1365,92 +1741,70 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
             )
 
     @staticmethod
-    def validate_help_forum_channel_thread(thread: discord.Thread) -> bool:
-        return any(
-            (
-                INVALID_HELP_THREAD_SCANNING_ENABLED[caution_type]
-                and (
-                    dict(any=any, all=all)[
-                        INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type]["mode"]
-                    ]
-                )(
-                    (
-                        INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type]["fields"][
-                            "title"
-                        ].search(
-                            " ".join(
-                                thread.name.replace(f"│{thread.owner_id}", "")
-                                .replace(f"│{f'{thread.owner_id}'[-6:]}", "")
-                                .split()
-                            )  # trim and normalize whitespace
-                        ),  # normalize whitespace
-                        INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type]["fields"][
-                            "content"
-                        ].search(
-                            " ".join(
-                                thread.starter_message.content.split()
-                                if thread.starter_message
-                                else ""
-                            )
-                        ),  # trim and normalize whitespace
-                    )
-                )
-                for caution_type in INVALID_HELP_THREAD_TYPES
+    def iter_help_forum_channel_thread_cautions(
+        thread: discord.Thread,
+    ) -> Iterator[str]:
+        title = _normalize_help_thread_title(thread.name, thread.owner_id)
+        title_might_match = INVALID_HELP_THREAD_TITLE_PATTERN.search(title) is not None
+        content = None
+
+        for (
+            caution_type,
+            match_all,
+            title_pattern,
+            content_pattern,
+        ) in INVALID_HELP_THREAD_SCANS:
+            title_matched = (
+                title_might_match and title_pattern.search(title) is not None
             )
-        )
+            if content_pattern is None:  # content always matches
+                if title_matched or not match_all:
+                    yield caution_type
+                continue
+            elif title_matched != match_all:  # result is decided by the title
+                if title_matched:
+                    yield caution_type
+                continue
+
+            if content is None:
+                content = " ".join(
+                    thread.starter_message.content.split()
+                    if thread.starter_message
+                    else ""
+                )  # trim and normalize whitespace
+
+            if content_pattern.search(content) is not None:
+                yield caution_type
+
+    @staticmethod
+    def validate_help_forum_channel_thread(thread: discord.Thread) -> bool:
+        return any(HelpForumsPreCog.iter_help_forum_channel_thread_cautions(thread))
 
     @staticmethod
     def get_help_forum_channel_thread_cautions(
         thread: discord.Thread,
     ) -> tuple[str, ...]:
-        return tuple(
-            (
-                caution_type
-                for caution_type in INVALID_HELP_THREAD_TYPES
-                if INVALID_HELP_THREAD_SCANNING_ENABLED[caution_type]
-                and (
-                    dict(any=any, all=all)[
-                        INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type]["mode"]
-                    ]
-                )(
-                    (
-                        INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type]["fields"][
-                            "title"
-                        ].search(
-                            " ".join(
-                                thread.name.replace(f"│{thread.owner_id}", "")
-                                .replace(f"│{f'{thread.owner_id}'[-6:]}", "")
-                                .split()
-                            )  # trim and normalize whitespace
-                        ),
-                        INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type]["fields"][
-                            "content"
-                        ].search(
-                            " ".join(
-                                thread.starter_message.content.split()
-                                if thread.starter_message
-                                else ""
-                            )
-                        ),  # trim and normalize whitespace
-                    )
-                )
-            )
-        )
+        return tuple(HelpForumsPreCog.iter_help_forum_channel_thread_cautions(thread))
 
     @staticmethod
     async def caution_about_help_forum_channel_thread(
         thread: discord.Thread, *caution_types: str
     ) -> list[discord.Message]:
-        caution_messages = []
+        """Send the given caution messages to a help thread in order. If sending one
+        fails, the remaining ones are skipped, but the messages sent so far are
+        still returned, so that they can be recorded and cleaned up later.
+        """
+        content = f"help-post-alert(<@{thread.owner_id}>, **{thread.name}**)"
+        caution_messages: list[discord.Message] = []
         for caution_type in caution_types:
-            caution_messages.append(
-                await thread.send(
-                    content=f"help-post-alert(<@{thread.owner_id}>, **{thread.name}**)",
-                    embed=discord.Embed.from_dict(
-                        INVALID_HELP_THREAD_EMBEDS[caution_type]
-                    ),
+            try:
+                caution_messages.append(
+                    await thread.send(
+                        content=content, embed=_CAUTION_EMBEDS[caution_type]
+                    )
                 )
-            )
+            except discord.HTTPException:
+                break
 
         return caution_messages
 
@@ -1459,22 +1813,21 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
         thread: discord.Thread,
     ) -> bool:
         applied_tags = thread.applied_tags
-        valid = True
-        if applied_tags and not any(
-            tag.name.lower().startswith(("solved", "invalid")) for tag in applied_tags
-        ):
-            issue_tags = tuple(
-                tag for tag in applied_tags if tag.name.lower().startswith("issue")
-            )
-            aspect_tags = tuple(
-                tag
-                for tag in applied_tags
-                if not tag.name.lower().startswith(("issue", "unsolved", "abandoned"))
-            )
-            if not len(issue_tags) or len(issue_tags) > 1 or not aspect_tags:
-                valid = False
-
-        return valid
+        if not applied_tags:
+            return True
+
+        issue_tag_count = 0
+        has_aspect_tag = False
+        for tag in applied_tags:
+            tag_flags = _get_tag_flags(tag)
+            if tag_flags & (_SOLVED_TAG | _INVALID_TAG):
+                return True
+            elif tag_flags & _ISSUE_TAG:
+                issue_tag_count += 1
+            elif not tag_flags & (_UNSOLVED_TAG | _ABANDONED_TAG):
+                has_aspect_tag = True
+
+        return issue_tag_count == 1 and has_aspect_tag
 
     # @staticmethod
     # async def caution_about_regulars_help_forum_channel_thread_tags(
@@ -1626,25 +1979,7 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
             datetime.datetime: The time.
         """
         last_active = thread.created_at
-        last_message = thread.last_message
-        if last_message is None:
-            last_message_found = False
-            if thread.last_message_id is not None:
-                try:
-                    last_message = await thread.fetch_message(thread.last_message_id)
-                    last_message_found = True
-                except discord.NotFound:
-                    pass
-
-            if not last_message_found:
-                try:
-                    last_messages = [msg async for msg in thread.history(limit=1)]
-                    if last_messages:
-                        last_message = last_messages[0]
-                except discord.HTTPException:
-                    pass
-
-        if last_message is not None:
+        if last_message := await HelpForumsPreCog.fetch_last_thread_message(thread):
             last_active = last_message.created_at
 
         return last_active  # type: ignore
@@ -1667,20 +2002,12 @@ class HelpForumsPreCog(BaseExtensionCog, name="helpforums-pre"):
         """
         last_message = thread.last_message
         if last_message is None:
-            last_message_found = False
-            if thread.last_message_id is not None:
-                try:
-                    last_message = await thread.fetch_message(thread.last_message_id)
-                    last_message_found = True
-                except discord.NotFound:
-                    pass
-
-            if not last_message_found:
-                try:
-                    last_messages = [msg async for msg in thread.history(limit=1)]
-                    if last_messages:
-                        last_message = last_messages[0]
-                except discord.HTTPException:
-                    pass
+            # `history()` yields the most recent message that still exists, so
+            # fetching `last_message_id` first would only cost an extra request
+            try:
+                async for msg in thread.history(limit=1):
+                    last_message = msg
+            except discord.HTTPException:
+                pass
 
         return last_message
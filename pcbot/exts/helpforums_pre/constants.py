@@ -24,6 +24,8 @@ HELP_FORUM_CHANNEL_IDS = {
     "python": 1022244052088934461,  # python-help
 }
 
+HELP_FORUM_CHANNEL_IDS_SET = frozenset(HELP_FORUM_CHANNEL_IDS.values())
+
 INVALID_HELP_THREAD_TYPES = {
     "thread_title_too_short",
     "member_asking_for_help",
@@ -103,6 +105,43 @@ INVALID_HELP_THREAD_REGEX_PATTERNS = {
         },
     },
 }
+# (caution_type, match_all_fields, title_pattern, content_pattern) for every enabled
+# caution type, with match-anything content patterns replaced by None
+INVALID_HELP_THREAD_SCANS: tuple[
+    tuple[str, bool, re.Pattern[str], re.Pattern[str] | None], ...
+] = tuple(
+    (
+        caution_type,
+        INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type]["mode"] == "all",
+        INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type]["fields"]["title"],
+        None
+        if (
+            content_pattern := INVALID_HELP_THREAD_REGEX_PATTERNS[caution_type][
+                "fields"
+            ]["content"]
+        ).pattern
+        == ".*"
+        else content_pattern,
+    )
+    for caution_type in INVALID_HELP_THREAD_TYPES
+    if INVALID_HELP_THREAD_SCANNING_ENABLED[caution_type]
+)
+
+_SCOPED_REGEX_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+
+# matches a title if and only if any of the title patterns of INVALID_HELP_THREAD_SCANS
+# does, so that most titles can be ruled out with a single search
+INVALID_HELP_THREAD_TITLE_PATTERN = re.compile(
+    "|".join(
+        "(?%s:%s)"
+        % (
+            "".join(c for flag, c in _SCOPED_REGEX_FLAGS if title_pattern.flags & flag),
+            title_pattern.pattern,
+        )
+        for _, _, title_pattern, _ in INVALID_HELP_THREAD_SCANS
+    )
+)
+
 INVALID_HELP_THREAD_EMBEDS = {
     "thread_title_too_short": {
         "title": "Whoops, your post title must be at least "
@@ -42,5 +42,61 @@ MIGRATIONS: list[Revision] = _(
                 "postgresql": [f"DROP TABLE '{DB_PREFIX}inactive_help_thread_data';"],
             },
         },
+        {  # revision 1
+            "date": "2026-10-14T12:00:00",
+            "description": "Store caution message IDs of bad help threads as JSON text",
+            # The old table is kept as a legacy table, whose pickled rows are
+            # converted to JSON and moved into the new table once by the extension
+            "migrate": {
+                "sqlite": [
+                    f"ALTER TABLE '{DB_PREFIX}bad_help_thread_data' "
+                    f"RENAME TO '{DB_PREFIX}bad_help_thread_data_legacy';",
+                    f"CREATE TABLE '{DB_PREFIX}bad_help_thread_data' ("
+                    "    thread_id BIGINT PRIMARY KEY, "
+                    "    last_cautioned_ts REAL NOT NULL, "
+                    "    caution_message_ids TEXT NOT NULL);\n\n",
+                ],
+                "postgresql": [
+                    f"ALTER TABLE '{DB_PREFIX}bad_help_thread_data' "
+                    f"RENAME TO '{DB_PREFIX}bad_help_thread_data_legacy';",
+                    f"CREATE TABLE '{DB_PREFIX}bad_help_thread_data' ("
+                    "    thread_id BIGINT PRIMARY KEY, "
+                    "    last_cautioned_ts DOUBLE PRECISION NOT NULL, "
+                    "    caution_message_ids TEXT NOT NULL);\n\n",
+                ],
+            },
+            # JSON caution message IDs can't be pickled in SQL, so rolling back
+            # discards all stored bad help thread data
+            "rollback": {
+                "sqlite": [
+                    f"DROP TABLE IF EXISTS '{DB_PREFIX}bad_help_thread_data_legacy';",
+                    f"DROP TABLE '{DB_PREFIX}bad_help_thread_data';",
+                    f"CREATE TABLE '{DB_PREFIX}bad_help_thread_data' ("
+                    "    thread_id BIGINT PRIMARY KEY, "
+                    "    last_cautioned_ts REAL NOT NULL, "
+                    "    caution_message_ids BLOB NOT NULL);\n\n",
+                ],
+                "postgresql": [
+                    f"DROP TABLE IF EXISTS '{DB_PREFIX}bad_help_thread_data_legacy';",
+                    f"DROP TABLE '{DB_PREFIX}bad_help_thread_data';",
+                    f"CREATE TABLE '{DB_PREFIX}bad_help_thread_data' ("
+                    "    thread_id BIGINT PRIMARY KEY, "
+                    "    last_cautioned_ts DOUBLE PRECISION NOT NULL, "
+                    "    caution_message_ids BYTEA NOT NULL);\n\n",
+                ],
+            },
+            "delete": {
+                "sqlite": [
+                    f"DROP TABLE IF EXISTS '{DB_PREFIX}bad_help_thread_data_legacy';",
+                    f"DROP TABLE '{DB_PREFIX}bad_help_thread_data';",
+                    f"DROP TABLE '{DB_PREFIX}inactive_help_thread_data';",
+                ],
+                "postgresql": [
+                    f"DROP TABLE IF EXISTS '{DB_PREFIX}bad_help_thread_data_legacy';",
+                    f"DROP TABLE '{DB_PREFIX}bad_help_thread_data';",
+                    f"DROP TABLE '{DB_PREFIX}inactive_help_thread_data';",
+                ],
+            },
+        },
     ]
 )